@@ -13,6 +13,10 @@ class Settings(BaseSettings):
     audio_directory: Path = Path("test_audio")
     config_file: Path = Path("config.yaml")
     
+    # Transcription job settings
+    max_queued_transcriptions: int = 20
+    finished_job_ttl_seconds: int = 3600
+    
     # GitHub publishing settings
     github_repository_url: Optional[str] = None
     github_token: Optional[str] = None
@@ -24,6 +24,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("🛑 Shutting down Transcription Web UI API")
+    if directory_scanner.filesystem_scanner is not None:
+        directory_scanner.filesystem_scanner.close()
+    if transcription.transcription_manager is not None:
+        await transcription.transcription_manager.shutdown()
 
 
 app = FastAPI(
@@ -4,10 +4,13 @@ Implements requirements 1.1, 1.2, 1.4, 1.5 for directory-based file management.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
 from pathlib import Path
 import sys
 
+import orjson
+
 # Import the FileSystemScanner service
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
@@ -27,11 +30,17 @@ from ..config import get_settings
 
 router = APIRouter()
 
+# Global scanner instance so its caches are shared between requests
+filesystem_scanner: Optional[FileSystemScanner] = None
+
 
 def get_filesystem_scanner() -> FileSystemScanner:
     """Dependency to get FileSystemScanner instance."""
-    settings = get_settings()
-    return FileSystemScanner(settings.audio_directory)
+    global filesystem_scanner
+    if filesystem_scanner is None:
+        settings = get_settings()
+        filesystem_scanner = FileSystemScanner(settings.audio_directory)
+    return filesystem_scanner
 
 
 @router.post("/scan", response_model=DirectoryScanResult)
@@ -60,10 +69,14 @@ async def scan_directory(
         # Perform directory scan
         scan_result = await scanner.scan_directory(request.directory_path)
         
-        # Convert to API response format
+        # Convert to API response format, sharing one model per file between the listing and the groups.
+        # The scanner already produces correctly typed fields, so the models skip validation.
         audio_files = []
+        groups_detail = {group: [] for group in scan_result['seminar_groups']}
         for file_info in scan_result['audio_files']:
-            audio_files.append(AudioFileDetail(**file_info))
+            file_detail = AudioFileDetail.model_construct(**file_info.to_dict())
+            audio_files.append(file_detail)
+            groups_detail[file_info.seminar_group].append(file_detail)
         
         return DirectoryScanResult(
             directory=scan_result['directory'],
@@ -71,7 +84,7 @@ async def scan_directory(
             transcribed_files=scan_result['transcribed_files'],
             audio_files=audio_files,
             seminar_groups=scan_result['seminar_groups'],
-            groups_detail=scan_result['groups_detail'],
+            groups_detail=groups_detail,
             scan_timestamp=scan_result['scan_timestamp']
         )
         
@@ -81,6 +94,43 @@ async def scan_directory(
         raise HTTPException(status_code=500, detail=f"Failed to scan directory: {str(e)}")
 
 
+@router.get("/scan/stream")
+async def scan_directory_stream(
+    directory_path: str = Query(..., description="Path to the directory to scan"),
+    scanner: FileSystemScanner = Depends(get_filesystem_scanner)
+) -> StreamingResponse:
+    """
+    Scan a directory and stream each audio file as a server-sent event.
+    
+    Every processed file is sent as a 'file' event as soon as it is ready,
+    followed by a final 'complete' event with the number of files sent.
+    """
+    directory = Path(directory_path)
+    if not directory.exists():
+        raise HTTPException(status_code=404, detail=f"Directory not found: {directory_path}")
+    
+    if not directory.is_dir():
+        raise HTTPException(status_code=400, detail=f"Path is not a directory: {directory_path}")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        total_files = 0
+        try:
+            async for file_info in scanner.scan_directory_stream(directory_path):
+                total_files += 1
+                yield f"event: file\ndata: {orjson.dumps(file_info).decode()}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {orjson.dumps({'detail': f'Failed to scan directory: {str(e)}'}).decode()}\n\n"
+            return
+        
+        yield f"event: complete\ndata: {orjson.dumps({'total_files': total_files}).decode()}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.get("/metadata")
 async def get_audio_metadata(
     file_path: str = Query(..., description="Path to the audio file"),
@@ -154,7 +204,8 @@ async def clear_scanner_cache(
 
 @router.get("/validate/directory-permissions")
 async def check_directory_permissions(
-    directory_path: str = Query(..., description="Path to the directory to check")
+    directory_path: str = Query(..., description="Path to the directory to check"),
+    verify_actual: bool = Query(False, description="Confirm write access by creating a temporary file")
 ) -> DirectoryPermissions:
     """
     Check directory access permissions.
@@ -162,7 +213,7 @@ async def check_directory_permissions(
     This is part of optional task 2.3: File system validation.
     """
     try:
-        permissions = FileSystemValidator.check_directory_permissions(directory_path)
+        permissions = FileSystemValidator.check_directory_permissions(directory_path, verify_actual=verify_actual)
         return DirectoryPermissions(**permissions)
         
     except Exception as e:
@@ -171,7 +222,8 @@ async def check_directory_permissions(
 
 @router.get("/validate/audio-format")
 async def validate_audio_format(
-    file_path: str = Query(..., description="Path to the audio file to validate")
+    file_path: str = Query(..., description="Path to the audio file to validate"),
+    strict: bool = Query(False, description="Validate the container with ffprobe instead of the file header")
 ) -> AudioFormatValidation:
     """
     Validate audio file format.
@@ -179,7 +231,7 @@ async def validate_audio_format(
     This is part of optional task 2.3: File system validation.
     """
     try:
-        validation = FileSystemValidator.validate_audio_format(file_path)
+        validation = FileSystemValidator.validate_audio_format(file_path, strict=strict)
         return AudioFormatValidation(**validation)
         
     except Exception as e:
@@ -244,7 +296,7 @@ async def get_seminar_group_files(
             raise HTTPException(status_code=404, detail=f"Seminar group not found: {group_name}")
         
         group_files = scan_result['groups_detail'][group_name]
-        return [AudioFileDetail(**file_info) for file_info in group_files]
+        return [AudioFileDetail.model_construct(**file_info.to_dict()) for file_info in group_files]
         
     except HTTPException:
         raise
@@ -268,10 +320,10 @@ async def get_compressed_audio_status(
         
         # Analyze compressed audio status
         total_files = len(scan_result['audio_files'])
-        compressed_files = len([f for f in scan_result['audio_files'] if f.get('has_compressed_version')])
+        compressed_files = len([f for f in scan_result['audio_files'] if f.has_compressed_version])
         
-        total_original_size = sum(f.get('size', 0) for f in scan_result['audio_files'])
-        total_compressed_size = sum(f.get('compressed_size', 0) for f in scan_result['audio_files'] if f.get('has_compressed_version'))
+        total_original_size = sum(f.size for f in scan_result['audio_files'])
+        total_compressed_size = sum(f.compressed_size or 0 for f in scan_result['audio_files'] if f.has_compressed_version)
         
         compression_savings = 0
         if total_original_size > 0 and total_compressed_size > 0:
@@ -41,6 +41,8 @@ async def start_transcription(
             data={"job_id": job_id}
         )
         
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=429, detail="Too many transcription jobs queued, try again later")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start transcription: {str(e)}")
 
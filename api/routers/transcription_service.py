@@ -4,9 +4,9 @@ Implements requirements 2.1, 2.2, 2.4, 2.5 for transcription service integration
 """
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
-import hashlib
 import sys
 
 # Import the TranscriptionService
@@ -18,30 +18,39 @@ from ..models import (
     APIResponse,
     TranscriptionRequest
 )
+from ..services.file_id import FileIdIndex, generate_file_id
 from ..services.transcription_service import TranscriptionService
 from ..config import get_settings
 
 router = APIRouter()
 
+# File ID indexes by base directory, kept across requests
+_file_id_indexes: Dict[Path, FileIdIndex] = {}
 
+
+@lru_cache()
 def get_transcription_service() -> TranscriptionService:
-    """Dependency to get TranscriptionService instance."""
+    """
+    Dependency to get the shared TranscriptionService instance.
+    
+    The service reads the config file and sets up the orchestrator and
+    audio processor when created, so it is created once, not per request.
+    """
     settings = get_settings()
     return TranscriptionService(settings)
 
 
 def _generate_file_id(file_path: Path) -> str:
     """Generate consistent file ID from file path and metadata."""
-    file_info = f"{file_path}_{file_path.stat().st_mtime}_{file_path.stat().st_size}"
-    return hashlib.md5(file_info.encode()).hexdigest()[:12]
+    return generate_file_id(file_path)
 
 
 def _find_audio_file_by_id(file_id: str, base_directory: Path) -> Optional[Path]:
     """Find audio file by ID in the base directory."""
-    for file_path in base_directory.rglob("*.mp3"):
-        if _generate_file_id(file_path) == file_id:
-            return file_path
-    return None
+    index = _file_id_indexes.get(base_directory)
+    if index is None:
+        index = _file_id_indexes[base_directory] = FileIdIndex(base_directory, recursive=True)
+    return index.find(file_id)
 
 
 @router.post("/{audio_file_id}", response_model=TranscriptionResult)
@@ -2,15 +2,47 @@
 
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import FileResponse
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
-import json
+import os
+import shutil
+
+import orjson
 
 from ..models import APIResponse
 from ..config import get_settings
 
 router = APIRouter()
 
+# Parsed transcripts keyed by path, with the (mtime_ns, size) they were read at
+_transcript_cache: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+_TRANSCRIPT_CACHE_SIZE = 16
+
+
+def _load_transcript(transcript_file: Path) -> dict:
+    """
+    Load a transcript JSON file, reusing the parsed data while the file is unchanged.
+    
+    Args:
+        transcript_file: Path to the transcript JSON file
+        
+    Returns:
+        Parsed transcript data; callers must not modify it
+    """
+    stat = transcript_file.stat()
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _transcript_cache.get(transcript_file)
+    if cached and cached[0] == file_key:
+        return cached[1]
+    
+    transcript_data = orjson.loads(transcript_file.read_bytes())
+    
+    # Drop the oldest entry once the cache is full
+    if transcript_file not in _transcript_cache and len(_transcript_cache) >= _TRANSCRIPT_CACHE_SIZE:
+        del _transcript_cache[next(iter(_transcript_cache))]
+    _transcript_cache[transcript_file] = (file_key, transcript_data)
+    return transcript_data
+
 
 def get_audio_directory() -> Path:
     """Dependency to get audio directory path."""
@@ -51,11 +83,10 @@ async def get_transcript(
         
         # Load the transcript data
         print(f"📖 API: Loading transcript file...")
-        with open(transcript_file, 'r', encoding='utf-8') as f:
-            transcript_data = json.load(f)
+        transcript_data = _load_transcript(transcript_file)
         
         print(f"✅ API: Transcript loaded successfully, keys: {list(transcript_data.keys())}")
-        print(f"✅ API: Transcript data size: {len(json.dumps(transcript_data))} chars")
+        print(f"✅ API: Transcript file size: {transcript_file.stat().st_size} bytes")
         
         # Support both formats:
         # 1. Cache format: { "result": CorrectedDeepgramResponse }
@@ -101,15 +132,17 @@ async def save_transcript_corrections(
         if not corrections.get('corrections'):
             backup_file = transcript_file.with_suffix('.backup.json')
             if not backup_file.exists():
-                # Load original and save as backup
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    original_data = json.load(f)
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(original_data, f, indent=2, ensure_ascii=False)
-        
-        # Save the corrected transcript data
-        with open(transcript_file, 'w', encoding='utf-8') as f:
-            json.dump(corrections, f, indent=2, ensure_ascii=False)
+                # Copy the original bytes as backup, no need to parse and re-encode it
+                shutil.copyfile(transcript_file, backup_file)
+        
+        # Save the corrected transcript data; autosaves often send an unchanged
+        # document, which leaves the file (and its cached parse) untouched
+        content = orjson.dumps(corrections, option=orjson.OPT_INDENT_2)
+        if transcript_file.stat().st_size != len(content) or transcript_file.read_bytes() != content:
+            # Replace the file atomically so a failed write can't truncate the transcript
+            tmp_file = transcript_file.with_name(transcript_file.name + '.tmp')
+            tmp_file.write_bytes(content)
+            os.replace(tmp_file, transcript_file)
         
         return APIResponse(
             success=True,
@@ -142,8 +175,7 @@ async def get_transcript_status(
         
         # Load the transcript data to check for corrections
         try:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                transcript_data = json.load(f)
+            transcript_data = _load_transcript(transcript_file)
             
             corrections = transcript_data.get('corrections')
             
@@ -156,7 +188,7 @@ async def get_transcript_status(
                 "file_size": transcript_file.stat().st_size
             }
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "exists": True,
                 "status": "corrupted",
@@ -183,6 +215,7 @@ async def delete_transcript(
         
         # Delete the transcript file
         transcript_file.unlink()
+        _transcript_cache.pop(transcript_file, None)
         
         # Also delete backup if it exists
         backup_file = transcript_file.with_suffix('.backup.json')
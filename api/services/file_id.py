@@ -0,0 +1,86 @@
+"""Stable file IDs shared by the scanner, file manager and transcription endpoints."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def generate_file_id(file_path: Path, stat_result: Optional[os.stat_result] = None) -> str:
+    """
+    Generate a unique ID for a file based on its path and metadata.
+
+    The ID only has to be stable and collision-resistant, not secure, so it
+    uses a 6-byte BLAKE2b digest (12 hex characters) rather than MD5.
+
+    Args:
+        file_path: Path to the audio file
+        stat_result: Already obtained stat result, to avoid another stat call
+
+    Returns:
+        12-character hexadecimal file ID
+    """
+    if stat_result is None:
+        stat_result = file_path.stat()
+    file_info = f"{file_path}_{stat_result.st_mtime}_{stat_result.st_size}"
+    return hashlib.blake2b(file_info.encode(), digest_size=6).hexdigest()
+
+
+class FileIdIndex:
+    """
+    Map of file IDs to the MP3 files in a directory.
+
+    Lookups reuse the map from the last scan. The directory is only scanned
+    again when an ID is missing or no longer matches its file, which happens
+    after files are added, renamed or modified.
+    """
+
+    def __init__(self, directory: Path, recursive: bool = False):
+        self.directory = Path(directory)
+        self.recursive = recursive
+        self._paths: Dict[str, Path] = {}
+
+    def find(self, file_id: str) -> Optional[Path]:
+        """
+        Find the audio file with the given ID.
+
+        Args:
+            file_id: File ID as returned by generate_file_id
+
+        Returns:
+            Path to the audio file, or None if no file has this ID
+        """
+        file_path = self._paths.get(file_id)
+        if file_path is not None:
+            try:
+                if generate_file_id(file_path) == file_id:
+                    return file_path
+            except OSError:
+                pass
+
+        self._rebuild()
+        return self._paths.get(file_id)
+
+    def _rebuild(self) -> None:
+        """Scan the directory and map every MP3 file's ID to its path."""
+        # os.scandir entries carry the file type and reuse one stat call for
+        # the ID, so each file costs a single stat and no glob matching
+        paths: Dict[str, Path] = {}
+        pending = [str(self.directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                pending.append(entry.path)
+                        elif entry.name.lower().endswith('.mp3') and entry.is_file():
+                            try:
+                                stat_result = entry.stat()
+                            except OSError:
+                                continue
+                            file_path = Path(entry.path)
+                            paths[generate_file_id(file_path, stat_result)] = file_path
+            except OSError:
+                continue
+        self._paths = paths
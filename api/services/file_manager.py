@@ -1,11 +1,15 @@
 """File management service for the web API."""
 
 import hashlib
-import json
+import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import asyncio
+import threading
+import time
+
+import orjson
 
 # Import from the existing transcription system
 import sys
@@ -16,8 +20,42 @@ from src.utils.cache_manager import CacheManager
 from src.utils.audio_validator import AudioValidator
 from src.utils.config import ConfigManager
 
+from .file_id import generate_file_id
 from ..models import AudioFileInfo, TranscriptionStatus, TranscriptionData, SpeakerSegment, PublicationStatus
 
+# A new manager is created per request, so writes are serialized with a
+# module-level lock held by the worker thread doing the write.
+_cache_write_lock = threading.Lock()
+
+# The audio file of each transcription cache file, keyed by the file's
+# (mtime_ns, size). Shared across managers for the same reason. Only that
+# path is kept, since the transcript itself is read from the file when it is
+# loaded; entries for removed files are dropped when the cache directory is
+# indexed again.
+_cache_entries: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Matching names in the transcription output directories by (directory,
+# suffix), valid while the directory's mtime_ns is unchanged. Most status
+# checks find nothing, and without this every one of them would list the
+# html, markdown and cache directories again.
+_directory_listings: Dict[Tuple[Path, str], Tuple[int, List[str]]] = {}
+
+# Cache file names by the audio file they belong to, per cache directory,
+# valid while the directory's mtime_ns is unchanged. Cache files are written
+# through a rename, which updates that mtime, so looking up one audio file
+# no longer reads every cache file.
+_cache_file_indexes: Dict[Path, Tuple[int, Dict[str, List[str]]]] = {}
+
+# Both caches above trust a directory's mtime. An entry added within the same
+# timestamp tick as a listing would leave the mtime unchanged, so a listing is
+# only kept once the directory has not been modified for this long.
+_MTIME_SETTLE_NS = 2_000_000_000
+
+
+def _is_settled(mtime_ns: int, listed_at_ns: int) -> bool:
+    """Check whether a directory listed at listed_at_ns was last modified long enough before."""
+    return listed_at_ns - mtime_ns > _MTIME_SETTLE_NS
+
 
 class AudioFileManager:
     """Manages audio files and their transcription status."""
@@ -37,8 +75,7 @@ class AudioFileManager:
     
     def _generate_file_id(self, file_path: Path) -> str:
         """Generate a unique ID for a file based on its path and metadata."""
-        file_info = f"{file_path}_{file_path.stat().st_mtime}_{file_path.stat().st_size}"
-        return hashlib.md5(file_info.encode()).hexdigest()[:12]
+        return generate_file_id(file_path)
     
     async def list_files(self) -> List[AudioFileInfo]:
         """List all MP3 files with their transcription status."""
@@ -50,6 +87,7 @@ class AudioFileManager:
     
     async def rescan_directory(self) -> int:
         """Force rescan of the audio directory."""
+        self.refresh_cache_index()
         await self._refresh_file_cache()
         return len(self._file_cache)
     
@@ -67,64 +105,178 @@ class AudioFileManager:
             return None
         
         try:
-            file_path = Path(file_info.path)
-            
-            # Look for cached transcription files directly
-            cache_dir = self.audio_directory / "transcriptions" / "cache"
-            if cache_dir.exists():
-                deepgram_transcription = None
-                other_transcription = None
-                
-                for cache_file in cache_dir.glob("*.json"):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            import json
-                            cache_data = json.load(f)
-                            
-                            # Check if this cache file is for our audio file
-                            if cache_data.get('audio_file') == str(file_path):
-                                result_data = cache_data.get('result', {})
-                                service = cache_data.get('service', 'unknown')
-                                
-                                # Convert to our API format
-                                speakers = []
-                                for segment in result_data.get('speakers', []):
-                                    speakers.append(SpeakerSegment(
-                                        speaker=segment.get('speaker', 'Unknown'),
-                                        start_time=segment.get('start_time', 0.0),
-                                        end_time=segment.get('end_time', 0.0),
-                                        text=segment.get('text', ''),
-                                        confidence=segment.get('confidence', 0.0)
-                                    ))
-                                
-                                transcription_data = TranscriptionData(
-                                    text=result_data.get('text', ''),
-                                    speakers=speakers,
-                                    duration=result_data.get('audio_duration', 0.0),
-                                    confidence=result_data.get('confidence', 0.0),
-                                    audio_duration=result_data.get('audio_duration', 0.0),
-                                    processing_time=result_data.get('processing_time', 0.0)
-                                )
-                                
-                                # Prefer Deepgram transcriptions
-                                if service.lower() == 'deepgram':
-                                    deepgram_transcription = transcription_data
-                                else:
-                                    other_transcription = transcription_data
-                                    
-                    except Exception as e:
-                        print(f"❌ Error reading cache file {cache_file}: {e}")
-                        continue
-                
-                # Return Deepgram transcription if available, otherwise return any other transcription
-                return deepgram_transcription or other_transcription
-            
-            return None
+            # Reading and parsing the cache files is blocking I/O, keep it off the event loop
+            return await asyncio.to_thread(self._load_cached_transcription, Path(file_info.path))
             
         except Exception as e:
             print(f"❌ Error loading transcription data: {e}")
             return None
     
+    def _load_cached_transcription(self, file_path: Path) -> Optional[TranscriptionData]:
+        """
+        Find the cached transcription for an audio file (runs in a worker thread).
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            The Deepgram transcription if cached, otherwise any other cached transcription
+        """
+        # Look for cached transcription files directly
+        cache_dir = self.audio_directory / "transcriptions" / "cache"
+        
+        deepgram_transcription = None
+        other_transcription = None
+        
+        for cache_file in self._find_cache_files(cache_dir, file_path):
+            try:
+                cache_data = orjson.loads(cache_file.read_bytes())
+                
+                # Check if this cache file is for our audio file
+                if cache_data.get('audio_file') == str(file_path):
+                    result_data = cache_data.get('result', {})
+                    service = cache_data.get('service', 'unknown')
+                    
+                    # Convert to our API format
+                    speakers = []
+                    for segment in result_data.get('speakers', []):
+                        speakers.append(SpeakerSegment(
+                            speaker=segment.get('speaker', 'Unknown'),
+                            start_time=segment.get('start_time', 0.0),
+                            end_time=segment.get('end_time', 0.0),
+                            text=segment.get('text', ''),
+                            confidence=segment.get('confidence', 0.0)
+                        ))
+                    
+                    transcription_data = TranscriptionData(
+                        text=result_data.get('text', ''),
+                        speakers=speakers,
+                        duration=result_data.get('audio_duration', 0.0),
+                        confidence=result_data.get('confidence', 0.0),
+                        audio_duration=result_data.get('audio_duration', 0.0),
+                        processing_time=result_data.get('processing_time', 0.0)
+                    )
+                    
+                    # Prefer Deepgram transcriptions
+                    if service.lower() == 'deepgram':
+                        deepgram_transcription = transcription_data
+                    else:
+                        other_transcription = transcription_data
+                        
+            except Exception as e:
+                print(f"❌ Error reading cache file {cache_file}: {e}")
+                continue
+        
+        # Return Deepgram transcription if available, otherwise return any other transcription
+        return deepgram_transcription or other_transcription
+    
+    def _list_directory(self, directory: Path, suffix: str) -> List[str]:
+        """
+        List the names in a directory that end with suffix.
+        
+        The listing is reused until the directory's mtime changes, which it
+        does whenever an entry is added, removed or renamed. Listings of a
+        directory modified in the last couple of seconds are not reused.
+        
+        Args:
+            directory: Directory to list
+            suffix: File name suffix to match, such as ".json"
+            
+        Returns:
+            Matching names, or an empty list if the directory does not exist
+        """
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = _directory_listings.get((directory, suffix))
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        listed_at_ns = time.time_ns()
+        with os.scandir(directory) as entries:
+            names = [entry.name for entry in entries if entry.name.endswith(suffix)]
+        if _is_settled(mtime_ns, listed_at_ns):
+            _directory_listings[(directory, suffix)] = (mtime_ns, names)
+        else:
+            _directory_listings.pop((directory, suffix), None)
+        return names
+    
+    def _find_cache_files(self, cache_dir: Path, file_path: Path) -> List[Path]:
+        """
+        Find the cache files holding a transcription of an audio file.
+        
+        The index of cache files by audio file is rebuilt when the cache
+        directory's mtime changes, or while that mtime is too recent to
+        trust. Each cache file is only parsed again once it changes.
+        
+        Args:
+            cache_dir: Transcription cache directory
+            file_path: Path to the audio file
+            
+        Returns:
+            Paths of the matching cache files
+        """
+        try:
+            mtime_ns = cache_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = _cache_file_indexes.get(cache_dir)
+        if cached and cached[0] == mtime_ns:
+            index = cached[1]
+        else:
+            listed_at_ns = time.time_ns()
+            index = {}
+            for cache_name in self._list_directory(cache_dir, ".json"):
+                try:
+                    audio_file = self._read_cache_entry(cache_dir / cache_name)['audio_file']
+                except Exception as e:
+                    print(f"❌ Error reading cache file {cache_dir / cache_name}: {e}")
+                    continue
+                index.setdefault(audio_file, []).append(cache_name)
+            if _is_settled(mtime_ns, listed_at_ns):
+                _cache_file_indexes[cache_dir] = (mtime_ns, index)
+            else:
+                _cache_file_indexes.pop(cache_dir, None)
+            
+            # Forget entries of cache files that no longer exist
+            indexed_files = {cache_dir / cache_name for cache_names in index.values() for cache_name in cache_names}
+            for cache_file in [path for path in _cache_entries if path.parent == cache_dir]:
+                if cache_file not in indexed_files:
+                    _cache_entries.pop(cache_file, None)
+        
+        return [cache_dir / cache_name for cache_name in index.get(str(file_path), [])]
+    
+    def refresh_cache_index(self):
+        """Drop the cache file index so the next lookup reads every cache file again."""
+        _cache_file_indexes.pop(self.audio_directory / "transcriptions" / "cache", None)
+    
+    def _read_cache_entry(self, cache_file: Path) -> Dict[str, Any]:
+        """
+        Read which audio file a cache file belongs to.
+        
+        Cache files include the full raw service response, so the audio file
+        is kept in memory until the cache file's mtime or size changes.
+        
+        Args:
+            cache_file: Path to the transcription cache file
+            
+        Returns:
+            Dict with 'audio_file'
+        """
+        stat_result = cache_file.stat()
+        file_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _cache_entries.get(cache_file)
+        if cached and cached[0] == file_key:
+            return cached[1]
+        
+        cache_data = orjson.loads(cache_file.read_bytes())
+        entry = {'audio_file': cache_data.get('audio_file')}
+        _cache_entries[cache_file] = (file_key, entry)
+        return entry
+    
     async def save_transcription_data(self, file_id: str, transcription_data: TranscriptionData) -> bool:
         """Save transcription data for a specific file."""
         file_info = await self.get_file_info(file_id)
@@ -134,11 +286,8 @@ class AudioFileManager:
         try:
             file_path = Path(file_info.path)
             
-            # Create cache directory if it doesn't exist
-            cache_dir = self.audio_directory / "transcriptions" / "cache"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            
             # Generate cache filename
+            cache_dir = self.audio_directory / "transcriptions" / "cache"
             cache_filename = f"{file_path.stem}_{file_id}.json"
             cache_file_path = cache_dir / cache_filename
             
@@ -166,9 +315,8 @@ class AudioFileManager:
                 }
             }
             
-            # Save to cache file
-            with open(cache_file_path, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            # Save to cache file without blocking the event loop
+            await asyncio.to_thread(self._write_cache_file, cache_file_path, cache_data)
             
             # Update file cache
             await self._refresh_single_file(file_path)
@@ -195,14 +343,15 @@ class AudioFileManager:
                 if self.cache_manager.delete_result(cache_key):
                     deleted_any = True
             
-            # Also delete any direct cache files
+            # Also delete any direct cache files, without checking first
+            # whether the directory or file exists
             cache_dir = self.audio_directory / "transcriptions" / "cache"
-            if cache_dir.exists():
-                cache_filename = f"{file_path.stem}_{file_id}.json"
-                cache_file_path = cache_dir / cache_filename
-                if cache_file_path.exists():
-                    cache_file_path.unlink()
-                    deleted_any = True
+            cache_filename = f"{file_path.stem}_{file_id}.json"
+            try:
+                (cache_dir / cache_filename).unlink()
+                deleted_any = True
+            except FileNotFoundError:
+                pass
             
             # Update file cache
             if deleted_any:
@@ -214,6 +363,21 @@ class AudioFileManager:
             print(f"❌ Error deleting transcription: {e}")
             return False
     
+    def _write_cache_file(self, cache_file_path: Path, cache_data: Dict[str, Any]):
+        """
+        Write a transcription cache file (runs in a worker thread).
+        
+        The data goes to a temporary file that is renamed over the cache
+        file, so a crash mid-write never leaves truncated JSON behind. The
+        JSON is compact, since cache files are not meant to be read by hand.
+        """
+        with _cache_write_lock:
+            # Create cache directory if it doesn't exist
+            cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file_path.with_name(cache_file_path.name + '.tmp')
+            tmp_path.write_bytes(orjson.dumps(cache_data))
+            os.replace(tmp_path, cache_file_path)
+    
     def _should_refresh_cache(self) -> bool:
         """Check if the file cache should be refreshed."""
         if not self._cache_timestamp:
@@ -225,8 +389,8 @@ class AudioFileManager:
     async def _refresh_file_cache(self):
         """Refresh the internal file cache."""
         try:
-            # Scan for MP3 files
-            mp3_files = self.scanner.scan_mp3_files()
+            # Scan for MP3 files in a worker thread, the directory walk blocks
+            mp3_files = await asyncio.to_thread(self.scanner.scan_mp3_files)
             
             # Process each file
             new_cache = {}
@@ -302,30 +466,19 @@ class AudioFileManager:
             
             # Check HTML directory
             html_dir = transcriptions_dir / "html"
-            if html_dir.exists():
-                for html_file in html_dir.glob("*.html"):
-                    if file_path.stem in html_file.name:
-                        return True, TranscriptionStatus.COMPLETED
+            for html_name in self._list_directory(html_dir, ".html"):
+                if file_path.stem in html_name:
+                    return True, TranscriptionStatus.COMPLETED
             
             # Check Markdown directory  
             md_dir = transcriptions_dir / "markdown"
-            if md_dir.exists():
-                for md_file in md_dir.glob("*.md"):
-                    if file_path.stem in md_file.name:
-                        return True, TranscriptionStatus.COMPLETED
+            for md_name in self._list_directory(md_dir, ".md"):
+                if file_path.stem in md_name:
+                    return True, TranscriptionStatus.COMPLETED
             
             # Check for cached transcriptions
-            cache_dir = transcriptions_dir / "cache"
-            if cache_dir.exists():
-                for cache_file in cache_dir.glob("*.json"):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            import json
-                            cache_data = json.load(f)
-                            if cache_data.get('audio_file') == str(file_path):
-                                return True, TranscriptionStatus.COMPLETED
-                    except:
-                        continue
+            if self._find_cache_files(transcriptions_dir / "cache", file_path):
+                return True, TranscriptionStatus.COMPLETED
             
             return False, TranscriptionStatus.NONE
             
@@ -342,5 +495,6 @@ class AudioFileManager:
     def _get_cache_key(self, file_path: Path, service: str) -> str:
         """Generate cache key for a file and service."""
         # This should match the cache key generation in the transcription system
-        file_info = f"{file_path}_{file_path.stat().st_mtime}_{file_path.stat().st_size}"
+        stat_result = file_path.stat()
+        file_info = f"{file_path}_{stat_result.st_mtime}_{stat_result.st_size}"
         return hashlib.md5(f"{file_info}_{service}".encode()).hexdigest()[:16]
\ No newline at end of file
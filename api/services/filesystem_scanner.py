@@ -3,15 +3,30 @@ FileSystemScanner service for directory-based audio file management.
 Implements requirements 1.1, 1.2, 1.3 for the Audio Transcription Web Manager.
 """
 
+import mmap
 import os
-import json
-import hashlib
+import re
+from stat import S_ISDIR
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from datetime import datetime
 import asyncio
 import subprocess
 
+import orjson
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdog is optional; without it every scan lists the directories again
+    FileSystemEventHandler = object
+    Observer = None
+
 # Import from the existing transcription system
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -19,6 +34,270 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.utils.audio_validator import AudioValidator
 from src.utils.cache_manager import CacheManager
 
+from .file_id import generate_file_id
+
+
+# Audio file extensions picked up by the scanner, matched case-insensitively
+AUDIO_EXTENSIONS = ('.mp3',)
+
+# Filesystem watcher events that mean directory contents changed; open/close
+# events caused by the scanner's own reads are ignored
+_CHANGE_EVENT_TYPES = frozenset({'created', 'deleted', 'modified', 'moved'})
+
+# MPEG audio Layer III lookup tables used by the in-process duration parser
+_MP3_BITRATES_KBPS = {
+    'mpeg1': (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    'mpeg2': (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),   # MPEG-2.5
+}
+_MP3_HEADER_SCAN_BYTES = 64 * 1024
+
+# Transcription files written by this project start with audio_file/service/
+# config/timestamp and put "text" first inside "result", so the status check
+# can usually tell from the beginning of the file. This is only a shortcut:
+# other layouts are fully parsed, and every summary is cached below.
+_TRANSCRIPTION_HEAD_BYTES = 64 * 1024
+_RESULT_TEXT_PATTERN = re.compile(rb'"result":\s*\{\s*"text":\s*"(.)')
+_TIMESTAMP_PATTERN = re.compile(rb'"timestamp":\s*"([^"\\]*)"')
+
+# Summaries of transcription and legacy cache files by path, with the file's
+# (mtime_ns, size). An entry can only be reused for the same file version, so
+# it outlives clear_cache(), and a file that needs a full parse is parsed once
+# per version rather than once per scan.
+_file_summaries: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+
+def _id3v2_size(header) -> int:
+    """
+    Return the size of the ID3v2 tag that starts with the given bytes.
+    
+    Args:
+        header: The first 10 bytes of the file
+        
+    Returns:
+        Size of the tag including its header and footer, or 0 if there is no tag
+    """
+    if len(header) < 10 or header[:3] != b'ID3':
+        return 0
+    # ID3v2 tag size is a 28-bit synchsafe integer
+    tag_size = ((header[6] & 0x7F) << 21 | (header[7] & 0x7F) << 14 |
+                (header[8] & 0x7F) << 7 | (header[9] & 0x7F))
+    return 10 + tag_size + (10 if header[5] & 0x10 else 0)
+
+
+def _parse_mp3_frame_header(data, offset: int) -> Optional[Tuple[int, int, int, int, int]]:
+    """
+    Parse the MPEG audio Layer III frame header at an offset.
+    
+    Args:
+        data: Bytes-like object holding at least 4 bytes from offset
+        offset: Position of the candidate header
+        
+    Returns:
+        (frame length, sample rate, samples per frame, bitrate, side info size),
+        or None if there is no valid Layer III header at offset
+    """
+    if data[offset] != 0xFF or (data[offset + 1] & 0xE0) != 0xE0:
+        return None
+    version_bits = (data[offset + 1] >> 3) & 0x03
+    layer_bits = (data[offset + 1] >> 1) & 0x03
+    bitrate_index = data[offset + 2] >> 4
+    sample_rate_index = (data[offset + 2] >> 2) & 0x03
+    if (version_bits == 1 or layer_bits != 1 or bitrate_index in (0, 15)
+            or sample_rate_index == 3):
+        return None
+    
+    is_mpeg1 = version_bits == 3
+    is_mono = (data[offset + 3] >> 6) == 3
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][sample_rate_index]
+    bitrate = _MP3_BITRATES_KBPS['mpeg1' if is_mpeg1 else 'mpeg2'][bitrate_index] * 1000
+    padding = (data[offset + 2] >> 1) & 0x01
+    frame_length = (144 if is_mpeg1 else 72) * bitrate // sample_rate + padding
+    side_info = (17 if is_mono else 32) if is_mpeg1 else (9 if is_mono else 17)
+    return frame_length, sample_rate, 1152 if is_mpeg1 else 576, bitrate, side_info
+
+
+def _read_mp3_duration(file_path: Path, file_size: Optional[int] = None) -> Optional[float]:
+    """
+    Read MP3 duration directly from the file headers without spawning ffprobe.
+    
+    Uses the Xing/Info or VBRI frame count when present (VBR files) and falls
+    back to a constant-bitrate estimate from the first frame header.
+    
+    Args:
+        file_path: Path to the MP3 file
+        file_size: File size in bytes if already known, to avoid another stat call
+        
+    Returns:
+        Duration in seconds, or None if no valid MPEG Layer III frame was found
+    """
+    try:
+        if file_size is None:
+            file_size = file_path.stat().st_size
+        with open(file_path, 'rb') as f:
+            audio_start = _id3v2_size(f.read(10))
+            f.seek(audio_start)
+            data = f.read(_MP3_HEADER_SCAN_BYTES)
+    except OSError:
+        return None
+    
+    for offset in range(len(data) - 3):
+        header = _parse_mp3_frame_header(data, offset)
+        if header is None:
+            continue
+        
+        _, sample_rate, samples_per_frame, bitrate, side_info = header
+        
+        # VBR files carry the total frame count in a Xing/Info or VBRI header
+        xing = offset + 4 + side_info
+        if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+            flags = int.from_bytes(data[xing + 4:xing + 8], 'big')
+            if flags & 0x01:
+                frames = int.from_bytes(data[xing + 8:xing + 12], 'big')
+                return frames * samples_per_frame / sample_rate
+        vbri = offset + 36
+        if data[vbri:vbri + 4] == b'VBRI' and len(data) >= vbri + 18:
+            frames = int.from_bytes(data[vbri + 14:vbri + 18], 'big')
+            return frames * samples_per_frame / sample_rate
+        
+        audio_bytes = file_size - audio_start - offset
+        return audio_bytes * 8 / bitrate
+    
+    return None
+
+
+def _count_mp3_frames_duration(file_path: str) -> Optional[float]:
+    """
+    Compute MP3 duration by walking every frame header in the file.
+    
+    Slow and CPU-bound, so it runs in a worker process. Used only when
+    neither the header parser nor ffprobe could determine a duration. A
+    frame counts only if the next frame header (or the end of the file)
+    follows it, which skips false sync words in junk data.
+    
+    Args:
+        file_path: Path to the MP3 file
+        
+    Returns:
+        Duration in seconds, or None if no chain of valid frames was found
+    """
+    try:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = _id3v2_size(data[:10])
+            
+            end = len(data) - 4
+            duration = 0.0
+            frames = 0
+            while offset <= end:
+                offset = data.find(b'\xff', offset, end + 1)
+                if offset < 0:
+                    break
+                
+                header = _parse_mp3_frame_header(data, offset)
+                if header is None:
+                    offset += 1
+                    continue
+                
+                frame_length, sample_rate, samples_per_frame, _, _ = header
+                next_offset = offset + frame_length
+                if next_offset <= end and _parse_mp3_frame_header(data, next_offset) is None:
+                    offset += 1
+                    continue
+                
+                duration += samples_per_frame / sample_rate
+                frames += 1
+                offset = next_offset
+    except (OSError, ValueError):
+        # ValueError: empty files cannot be memory-mapped
+        return None
+    
+    return duration if frames else None
+
+
+def _path_prefix(directory: Path) -> str:
+    """Return the string prefix that paths under a directory start with."""
+    directory_str = str(directory)
+    # Path('.') / 'x' is rendered as 'x', so the current directory has no prefix
+    return '' if directory_str == os.curdir else os.path.join(directory_str, '')
+
+
+@lru_cache(maxsize=8192)
+def _format_mtime(mtime_seconds: int) -> str:
+    """
+    Format a modification time as a local ISO timestamp.
+    
+    Files in one seminar directory tend to share modification times, so the
+    formatted strings are cached by whole second.
+    """
+    return datetime.fromtimestamp(mtime_seconds).isoformat()
+
+
+class _ScanCacheInvalidator(FileSystemEventHandler):
+    """Drops a scanner's cached results for paths the filesystem watcher reports as changed."""
+    
+    def __init__(self, scanner: 'FileSystemScanner', loop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self.scanner = scanner
+        self.loop = loop
+    
+    def on_any_event(self, event):
+        if event.event_type not in _CHANGE_EVENT_TYPES:
+            return
+        
+        # Events arrive on the observer thread, while the caches belong to
+        # the event loop, so the invalidation is handed over to the loop
+        paths = [event.src_path]
+        dest_path = getattr(event, 'dest_path', None)
+        if dest_path:
+            paths.append(dest_path)
+        try:
+            for path in paths:
+                self.loop.call_soon_threadsafe(self.scanner._invalidate_path, path)
+        except RuntimeError:
+            # The event loop has been closed
+            pass
+
+
+@dataclass
+class ScannedAudioFile:
+    """
+    Information collected for one audio file during a directory scan.
+    
+    Scans keep one of these per file, so it uses __slots__ rather than a
+    per-instance dict. Convert with to_dict() where a plain dict is needed.
+    """
+    __slots__ = (
+        'path', 'filename', 'size', 'duration', 'file_id', 'last_modified', 'seminar_group',
+        'transcription_status', 'transcription_files', 'cache_files',
+        'last_transcription_attempt', 'transcription_error',
+        'has_compressed_version', 'compressed_size', 'compressed_path', 'compression_ratio'
+    )
+    
+    path: str
+    filename: str
+    size: int
+    duration: float
+    file_id: str
+    last_modified: str
+    seminar_group: str
+    transcription_status: str
+    transcription_files: List[str]
+    cache_files: List[str]
+    last_transcription_attempt: Optional[str]
+    transcription_error: Optional[str]
+    has_compressed_version: bool
+    compressed_size: Optional[int]
+    compressed_path: Optional[str]
+    compression_ratio: Optional[float]
+    
+    def to_dict(self) -> Dict:
+        """Return the fields as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class FileSystemScanner:
     """
@@ -26,15 +305,47 @@ class FileSystemScanner:
     Provides directory-based organization and metadata extraction.
     """
     
-    def __init__(self, base_directory: Optional[Path] = None):
-        """Initialize the FileSystemScanner."""
+    # Directories that never contain original audio files; pruned during the walk
+    SKIP_DIRS = frozenset({'compressed', 'transcriptions', '__pycache__', '.git'})
+    
+    def __init__(self, base_directory: Optional[Path] = None, follow_symlinks: bool = False):
+        """
+        Initialize the FileSystemScanner.
+        
+        Args:
+            base_directory: Directory that reported paths are made relative to
+            follow_symlinks: Descend into symlinked directories and include
+                symlinked files during scans
+        """
         self.base_directory = Path(base_directory) if base_directory else None
+        self.follow_symlinks = follow_symlinks
+        
+        # Prefix stripped from scanned paths to make them relative to base_directory;
+        # plain string handling avoids building Path objects for every file
+        self._base_dir_prefix = _path_prefix(self.base_directory) if self.base_directory else None
         self.audio_validator = AudioValidator()
         
         # Cache for performance
         self._directory_cache: Dict[str, Dict] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
-        self._cache_ttl = 300  # 5 minutes cache TTL
+        self._cache_ttl = 300  # 5 minutes TTL for sibling listings of watched directories
+        self._sibling_cache: Dict[str, Dict] = {}
+        
+        # Directories known to have neither transcriptions/ nor compressed/,
+        # keyed by path -> time the absence was observed
+        self._negative_dir_cache: Dict[str, datetime] = {}
+        
+        self.max_concurrent_files = 16  # Limit concurrent per-file metadata work
+        
+        # Filesystem watcher (when watchdog is installed) that invalidates cached
+        # scans on change, so watched directories are not rescanned on a timer
+        self._observer = None
+        self._watched_directories: List[str] = []
+        self._invalidation_count = 0
+        
+        # Worker processes for the CPU-bound frame-counting duration fallback,
+        # started on first use
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
     
     async def scan_directory(self, directory_path: str) -> Dict:
         """
@@ -46,60 +357,30 @@ class FileSystemScanner:
         Returns:
             Dictionary containing audio files organized by seminar groups
         """
-        directory = Path(directory_path)
-        
-        if not directory.exists():
-            raise FileNotFoundError(f"Directory does not exist: {directory_path}")
-        
-        if not directory.is_dir():
-            raise NotADirectoryError(f"Path is not a directory: {directory_path}")
+        directory = self._validate_scan_directory(directory_path)
         
         # Check cache first
         cache_key = str(directory.absolute())
         if self._is_cache_valid(cache_key):
             return self._directory_cache[cache_key]
         
-        # Scan for MP3 files recursively, excluding compressed directories
-        audio_files = []
-        seminar_groups = {}
+        self._watch_directory(cache_key)
+        self._drop_unwatched_listings(cache_key)
+        invalidation_count = self._invalidation_count
         
-        for mp3_file in directory.rglob("*.mp3"):
-            try:
-                # Skip files in compressed directories - they're not original audio files
-                if "compressed" in mp3_file.parts:
-                    continue
-                
-                # Skip files in transcriptions directories - they're not original audio files
-                if "transcriptions" in mp3_file.parts:
-                    continue
-                
-                # Get seminar group from directory structure
-                seminar_group = self._get_seminar_group(mp3_file, directory)
-                
-                # Get file metadata
-                file_info = await self._get_audio_file_info(mp3_file)
-                
-                # Check transcription status
-                transcription_status = await self._check_transcription_status(mp3_file)
-                file_info.update(transcription_status)
-                
-                # Check for compressed audio
-                compressed_info = await self._check_compressed_audio(mp3_file)
-                file_info.update(compressed_info)
-                
-                # Add seminar group info
-                file_info['seminar_group'] = seminar_group
-                
-                audio_files.append(file_info)
-                
-                # Organize by seminar group
-                if seminar_group not in seminar_groups:
-                    seminar_groups[seminar_group] = []
-                seminar_groups[seminar_group].append(file_info)
-                
-            except Exception as e:
-                print(f"❌ Error processing {mp3_file}: {e}")
-                continue
+        # Scan for MP3 files recursively, excluding compressed directories.
+        # Files arrive in completion order, so sort them for a stable listing.
+        audio_files = [file_info async for file_info in self._iter_files(directory)]
+        audio_files.sort(key=lambda file_info: file_info.path)
+        
+        seminar_groups = defaultdict(list)
+        transcribed_files = 0
+        
+        for file_info in audio_files:
+            # Organize by seminar group
+            seminar_groups[file_info.seminar_group].append(file_info)
+            if file_info.transcription_status == 'completed':
+                transcribed_files += 1
         
         # Prepare result
         result = {
@@ -107,17 +388,87 @@ class FileSystemScanner:
             'total_files': len(audio_files),
             'audio_files': audio_files,
             'seminar_groups': list(seminar_groups.keys()),
-            'groups_detail': seminar_groups,
-            'transcribed_files': len([f for f in audio_files if f.get('transcription_status') == 'completed']),
+            'groups_detail': dict(seminar_groups),
+            'transcribed_files': transcribed_files,
             'scan_timestamp': datetime.now().isoformat()
         }
         
-        # Cache the result
-        self._directory_cache[cache_key] = result
-        self._cache_timestamps[cache_key] = datetime.now()
+        # Cache the result while the watcher keeps it current, unless it saw
+        # changes while scanning
+        if self._is_watched(cache_key) and invalidation_count == self._invalidation_count:
+            self._directory_cache[cache_key] = result
+            self._cache_timestamps[cache_key] = datetime.now()
         
         return result
     
+    async def scan_directory_stream(self, directory_path: str) -> AsyncIterator[ScannedAudioFile]:
+        """
+        Scan a directory and yield each audio file's information as soon as it is processed.
+        
+        Unlike scan_directory, nothing is cached or aggregated, so callers can
+        start sending results before the whole tree has been processed.
+        
+        Args:
+            directory_path: Path to the directory to scan
+            
+        Yields:
+            ScannedAudioFile objects in completion order
+        """
+        directory = self._validate_scan_directory(directory_path)
+        self._drop_unwatched_listings(str(directory.absolute()))
+        
+        async for file_info in self._iter_files(directory):
+            yield file_info
+    
+    @staticmethod
+    def _validate_scan_directory(directory_path: str) -> Path:
+        """Check that a scan target exists and is a directory."""
+        directory = Path(directory_path)
+        
+        if not directory.exists():
+            raise FileNotFoundError(f"Directory does not exist: {directory_path}")
+        
+        if not directory.is_dir():
+            raise NotADirectoryError(f"Path is not a directory: {directory_path}")
+        
+        return directory
+    
+    async def _iter_files(self, directory: Path) -> AsyncIterator[ScannedAudioFile]:
+        """
+        Process every MP3 under a directory and yield results as they complete.
+        
+        Files that fail to process are logged and skipped.
+        """
+        mp3_files = self._find_audio_files(directory)
+        
+        # Read all durations in one pass instead of one ffprobe process per file
+        durations = await self._probe_durations_bulk(mp3_files)
+        
+        # Process files concurrently, bounded so a large directory doesn't
+        # open hundreds of files at once
+        semaphore = asyncio.BoundedSemaphore(self.max_concurrent_files)
+        
+        async def process_bounded(mp3_file: Path) -> Optional[ScannedAudioFile]:
+            async with semaphore:
+                try:
+                    return await self._process_one(
+                        mp3_file, mp3_files[mp3_file], directory, durations.get(mp3_file)
+                    )
+                except Exception as e:
+                    print(f"❌ Error processing {mp3_file}: {e}")
+                    return None
+        
+        tasks = [asyncio.ensure_future(process_bounded(mp3_file)) for mp3_file in mp3_files]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                file_info = await next_result
+                if file_info is not None:
+                    yield file_info
+        finally:
+            # Stop outstanding work if the consumer goes away mid-scan
+            for task in tasks:
+                task.cancel()
+    
     async def get_audio_metadata(self, file_path: str) -> Dict:
         """
         Extract detailed metadata from an audio file.
@@ -133,11 +484,12 @@ class FileSystemScanner:
         if not file_path.exists():
             raise FileNotFoundError(f"Audio file does not exist: {file_path}")
         
+        stat = file_path.stat()
         metadata = {
             'path': str(file_path),
             'filename': file_path.name,
-            'size': file_path.stat().st_size,
-            'last_modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+            'size': stat.st_size,
+            'last_modified': _format_mtime(int(stat.st_mtime))
         }
         
         # Get audio duration and format info
@@ -147,17 +499,129 @@ class FileSystemScanner:
             if duration:
                 metadata['duration'] = duration
             else:
-                # Fallback to audio validator
-                validation_result = self.audio_validator.validate_single_file(file_path)
-                if validation_result.get('is_valid'):
-                    metadata['duration'] = validation_result.get('duration', 0.0)
-                    metadata['format_info'] = validation_result.get('format_info', {})
+                # Fallback to walking the MP3 frames
+                duration = await self._get_audio_duration_frame_scan(file_path)
+                if duration is not None:
+                    metadata['duration'] = round(duration, 3)
         except Exception as e:
             print(f"⚠️ Could not extract audio metadata for {file_path}: {e}")
             metadata['duration'] = 0.0
         
         return metadata
     
+    def _find_audio_files(self, directory: Path) -> Dict[Path, os.stat_result]:
+        """
+        Walk a directory tree with os.scandir and collect MP3 files.
+        
+        Output directories (compressed/, transcriptions/) are pruned when the
+        walk reaches them instead of filtering every file by its path parts.
+        Directories seen without either are recorded in the negative cache.
+        
+        Symlinks are skipped unless follow_symlinks is set, in which case they
+        are visited after all real entries. Directories and files are tracked
+        by (st_dev, st_ino), so symlink cycles, bind mounts and hard links are
+        only visited once, preferring the real path over a symlinked one.
+        
+        Returns:
+            Mapping of MP3 file path to the stat result taken during the walk
+        """
+        mp3_files = {}
+        pending_dirs = [str(directory)]
+        scanned_at = datetime.now()
+        
+        try:
+            root_stat = directory.stat()
+            seen_inodes = {(root_stat.st_dev, root_stat.st_ino)}
+        except OSError:
+            seen_inodes = set()
+        
+        deferred_links = []
+        
+        def visit(entry_path: str, entry_stat: os.stat_result, is_dir: bool):
+            inode = (entry_stat.st_dev, entry_stat.st_ino)
+            if inode in seen_inodes:
+                return
+            seen_inodes.add(inode)
+            
+            if is_dir:
+                pending_dirs.append(entry_path)
+            else:
+                mp3_files[Path(entry_path)] = entry_stat
+        
+        while pending_dirs or deferred_links:
+            if not pending_dirs:
+                # Real entries are exhausted; follow the symlinks found on the way
+                for link in deferred_links:
+                    visit(*link)
+                deferred_links.clear()
+                continue
+            
+            current_dir = pending_dirs.pop()
+            has_sibling_dirs = False
+            for entry in self._scandir(current_dir):
+                try:
+                    is_dir = entry.is_dir()
+                    if is_dir and entry.name in ('transcriptions', 'compressed'):
+                        has_sibling_dirs = True
+                    
+                    is_symlink = entry.is_symlink()
+                    if is_symlink and not self.follow_symlinks:
+                        continue
+                    
+                    if is_dir:
+                        if entry.name in self.SKIP_DIRS:
+                            continue
+                    elif not (entry.name.lower().endswith(AUDIO_EXTENSIONS) and entry.is_file()):
+                        continue
+                    
+                    entry_stat = entry.stat()
+                except OSError:
+                    # Entry vanished between listing and stat
+                    continue
+                
+                if is_symlink:
+                    deferred_links.append((entry.path, entry_stat, is_dir))
+                else:
+                    visit(entry.path, entry_stat, is_dir)
+            
+            if has_sibling_dirs:
+                self._negative_dir_cache.pop(current_dir, None)
+            else:
+                self._negative_dir_cache[current_dir] = scanned_at
+        
+        return mp3_files
+    
+    async def _process_one(self, file_path: Path, file_stat: os.stat_result, base_directory: Path,
+                           duration: Optional[float] = None) -> ScannedAudioFile:
+        """
+        Collect metadata, transcription status and compressed audio info for one file.
+        
+        Args:
+            file_path: Path to the audio file
+            file_stat: Stat result for the audio file from the directory walk
+            base_directory: Base directory being scanned
+            duration: Duration already read by the bulk probe, if any
+            
+        Returns:
+            ScannedAudioFile with the combined file information
+        """
+        # Get file metadata
+        file_info = await self._get_audio_file_info(file_path, file_stat, duration)
+        
+        # Check transcription status
+        transcription_status = await self._check_transcription_status(file_path)
+        
+        # Check for compressed audio
+        compressed_info = self._check_compressed_audio(file_path, file_stat.st_size)
+        
+        return ScannedAudioFile(
+            **file_info,
+            **transcription_status,
+            **compressed_info,
+            # Add seminar group info from directory structure
+            seminar_group=self._get_seminar_group(file_path, base_directory)
+        )
+    
     async def check_transcription_status(self, file_path: str) -> Dict:
         """
         Check transcription status for a specific audio file.
@@ -169,6 +633,7 @@ class FileSystemScanner:
             Dictionary containing transcription status information
         """
         file_path = Path(file_path)
+        self._drop_unwatched_listings(os.path.abspath(os.path.dirname(str(file_path)) or os.curdir))
         return await self._check_transcription_status(file_path)
     
     def _get_seminar_group(self, file_path: Path, base_directory: Path) -> str:
@@ -182,55 +647,67 @@ class FileSystemScanner:
         Returns:
             Seminar group name based on directory structure
         """
-        try:
-            # Get relative path from base directory
-            relative_path = file_path.relative_to(base_directory)
-            
-            # If file is in a subdirectory, use the first subdirectory as group name
-            if len(relative_path.parts) > 1:
-                return relative_path.parts[0]
-            else:
-                # If file is directly in base directory, use directory name
-                return base_directory.name
-        except ValueError:
+        path_str = str(file_path)
+        base_prefix = _path_prefix(base_directory)
+        
+        if not path_str.startswith(base_prefix):
             # File is not under base directory
-            return file_path.parent.name
+            return os.path.basename(os.path.dirname(path_str))
+        
+        # Get relative path from base directory
+        relative_path = path_str[len(base_prefix):]
+        
+        # If file is in a subdirectory, use the first subdirectory as group name
+        if os.sep in relative_path:
+            return relative_path.split(os.sep, 1)[0]
+        else:
+            # If file is directly in base directory, use directory name
+            return base_directory.name
     
-    async def _get_audio_file_info(self, file_path: Path) -> Dict:
-        """Get basic information about an audio file."""
-        stat = file_path.stat()
+    async def _probe_durations_bulk(self, audio_files: Dict[Path, os.stat_result]) -> Dict[Path, float]:
+        """
+        Read durations for a batch of MP3 files in a single worker pass.
         
-        # Get audio duration
-        duration = 0.0
-        try:
-            # Try ffprobe first
-            duration = await self._get_audio_duration_ffprobe(file_path)
-            if duration is None:
-                # Fallback to audio validator
-                validation_result = self.audio_validator.validate_single_file(file_path)
-                if validation_result.get('is_valid'):
-                    duration = validation_result.get('duration', 0.0)
-        except Exception as e:
-            print(f"⚠️ Could not get duration for {file_path}: {e}")
-            duration = 0.0
+        Headers are parsed in-process; files the parser cannot handle are left
+        out so callers fall back to the single-file ffprobe path.
+        
+        Returns:
+            Mapping of path to duration in seconds
+        """
+        def read_all() -> Dict[Path, float]:
+            durations = {}
+            for path, file_stat in audio_files.items():
+                duration = _read_mp3_duration(path, file_stat.st_size)
+                if duration is not None:
+                    durations[path] = round(duration, 3)
+            return durations
+        
+        return await asyncio.to_thread(read_all)
+    
+    async def _get_audio_file_info(self, file_path: Path, stat: os.stat_result,
+                                   duration: Optional[float] = None) -> Dict:
+        """Get basic information about an audio file from its stat result."""
         
-        # Return relative path if base_directory is set, otherwise absolute path
-        if self.base_directory:
+        # Get audio duration unless it was already read by the bulk probe
+        if duration is None:
             try:
-                relative_path = str(file_path.relative_to(self.base_directory))
-            except ValueError:
-                # file_path is not under base_directory, use absolute path
-                relative_path = str(file_path)
-        else:
-            relative_path = str(file_path)
+                # Try ffprobe first
+                duration = await self._get_audio_duration_ffprobe(file_path)
+                if duration is None:
+                    # Fallback to walking the MP3 frames
+                    duration = await self._get_audio_duration_frame_scan(file_path)
+                    duration = round(duration, 3) if duration is not None else 0.0
+            except Exception as e:
+                print(f"⚠️ Could not get duration for {file_path}: {e}")
+                duration = 0.0
         
         return {
-            'path': relative_path,
+            'path': self._relative_path(str(file_path)),
             'filename': file_path.name,
             'size': stat.st_size,
             'duration': duration,
-            'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            'file_id': self._generate_file_id(file_path)
+            'last_modified': _format_mtime(int(stat.st_mtime)),
+            'file_id': self._generate_file_id(file_path, stat)
         }
     
     async def _check_transcription_status(self, file_path: Path) -> Dict:
@@ -248,76 +725,51 @@ class FileSystemScanner:
             'transcription_error': None
         }
         
+        parent_dir = os.path.dirname(str(file_path)) or os.curdir
+        if self._has_no_sibling_dirs(parent_dir):
+            return transcription_info
+        
         try:
             # Look for transcription files in the new structure: seminar_group/transcriptions/audio.json
-            base_dir = file_path.parent
             file_stem = file_path.stem
+            sibling_index = self._get_sibling_index(parent_dir)
             
             # Check for new structure: transcriptions directory with JSON files
-            transcriptions_dir = base_dir / "transcriptions"
-            if transcriptions_dir.exists():
-                # Look for the specific transcription JSON file
-                transcription_file = transcriptions_dir / f"{file_stem}.json"
-                if transcription_file.exists():
+            transcription_entry = sibling_index['transcriptions'].get(file_stem)
+            if transcription_entry:
+                transcription_file, transcription_stat = transcription_entry
+                try:
+                    summary = await self._read_cached(
+                        transcription_file, transcription_stat, self._read_transcription_summary
+                    )
+                    transcription_info['transcription_files'].append(self._relative_path(transcription_file))
+                    transcription_info['last_transcription_attempt'] = summary['timestamp']
+                    
+                    if summary['completed']:
+                        transcription_info['transcription_status'] = 'completed'
+                    else:
+                        transcription_info['transcription_status'] = 'failed'
+                        transcription_info['transcription_error'] = summary['error']
+                except Exception as e:
+                    print(f"⚠️ Error reading transcription file {transcription_file}: {e}")
+                    transcription_info['transcription_status'] = 'failed'
+                    transcription_info['transcription_error'] = f"File read error: {e}"
+            
+            # Also check for legacy structure (for backward compatibility)
+            if transcription_info['transcription_status'] == 'none':
+                for cache_file, cache_stat in sibling_index['legacy_cache']:
                     try:
-                        with open(transcription_file, 'r') as f:
-                            transcription_data = json.load(f)
-                            
-                            # Return relative path if base_directory is set, otherwise absolute path
-                            if self.base_directory:
-                                try:
-                                    relative_path = str(transcription_file.relative_to(self.base_directory))
-                                except ValueError:
-                                    relative_path = str(transcription_file)
-                            else:
-                                relative_path = str(transcription_file)
-                            
-                            transcription_info['transcription_files'].append(relative_path)
-                            transcription_info['last_transcription_attempt'] = transcription_data.get('timestamp')
-                            
-                            # Check if transcription was successful
-                            # Support both formats:
-                            # 1. Cache format: { "result": { "text": "..." } }
-                            # 2. Direct format: { "text": "..." } (from CLI output)
-                            has_result_text = transcription_data.get('result') and transcription_data['result'].get('text')
-                            has_direct_text = transcription_data.get('text') and transcription_data.get('raw_response')
+                        cache_data = await self._read_cached(cache_file, cache_stat, self._read_legacy_cache_summary)
+                        if cache_data['audio_file'] == str(file_path):
+                            transcription_info['cache_files'].append(self._relative_path(cache_file))
+                            transcription_info['last_transcription_attempt'] = cache_data['timestamp']
                             
-                            if has_result_text or has_direct_text:
+                            if cache_data['completed']:
                                 transcription_info['transcription_status'] = 'completed'
                             else:
                                 transcription_info['transcription_status'] = 'failed'
-                                transcription_info['transcription_error'] = transcription_data.get('error', 'Unknown error')
-                    except Exception as e:
-                        print(f"⚠️ Error reading transcription file {transcription_file}: {e}")
-                        transcription_info['transcription_status'] = 'failed'
-                        transcription_info['transcription_error'] = f"File read error: {e}"
-            
-            # Also check for legacy structure (for backward compatibility)
-            legacy_cache_dir = base_dir / "transcriptions" / "cache"
-            if legacy_cache_dir.exists() and transcription_info['transcription_status'] == 'none':
-                for cache_file in legacy_cache_dir.glob("*.json"):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            cache_data = json.load(f)
-                            if cache_data.get('audio_file') == str(file_path):
-                                # Return relative path if base_directory is set, otherwise absolute path
-                                if self.base_directory:
-                                    try:
-                                        relative_path = str(cache_file.relative_to(self.base_directory))
-                                    except ValueError:
-                                        relative_path = str(cache_file)
-                                else:
-                                    relative_path = str(cache_file)
-                                
-                                transcription_info['cache_files'].append(relative_path)
-                                transcription_info['last_transcription_attempt'] = cache_data.get('timestamp')
-                                
-                                if cache_data.get('result') and cache_data['result'].get('text'):
-                                    transcription_info['transcription_status'] = 'completed'
-                                else:
-                                    transcription_info['transcription_status'] = 'failed'
-                                    transcription_info['transcription_error'] = cache_data.get('error', 'Unknown error')
-                                break
+                                transcription_info['transcription_error'] = cache_data['error']
+                            break
                     except Exception as e:
                         print(f"⚠️ Error reading legacy cache file {cache_file}: {e}")
                         continue
@@ -328,10 +780,14 @@ class FileSystemScanner:
         
         return transcription_info
     
-    async def _check_compressed_audio(self, file_path: Path) -> Dict:
+    def _check_compressed_audio(self, file_path: Path, original_size: int) -> Dict:
         """
         Check for compressed audio versions of the file.
         
+        Args:
+            file_path: Path to the original audio file
+            original_size: Size of the original file in bytes
+            
         Returns:
             Dictionary with compressed audio information
         """
@@ -342,39 +798,90 @@ class FileSystemScanner:
             'compression_ratio': None
         }
         
+        parent_dir = os.path.dirname(str(file_path)) or os.curdir
+        if self._has_no_sibling_dirs(parent_dir):
+            return compressed_info
+        
         try:
             # Look for compressed version in the new structure: seminar_group/compressed/audio.mp3
-            base_dir = file_path.parent
-            compressed_dir = base_dir / "compressed"
-            
-            if compressed_dir.exists():
-                # Look for compressed file with the same name
-                compressed_file = compressed_dir / file_path.name
-                if compressed_file.exists():
-                    compressed_stat = compressed_file.stat()
-                    original_size = file_path.stat().st_size
-                    
-                    # Return relative path if base_directory is set, otherwise absolute path
-                    if self.base_directory:
-                        try:
-                            compressed_path = str(compressed_file.relative_to(self.base_directory))
-                        except ValueError:
-                            compressed_path = str(compressed_file)
-                    else:
-                        compressed_path = str(compressed_file)
-                    
-                    compressed_info.update({
-                        'has_compressed_version': True,
-                        'compressed_size': compressed_stat.st_size,
-                        'compressed_path': compressed_path,
-                        'compression_ratio': round((1 - compressed_stat.st_size / original_size) * 100, 1) if original_size > 0 else 0
-                    })
+            compressed_entry = self._get_sibling_index(parent_dir)['compressed'].get(file_path.name)
+            if compressed_entry:
+                compressed_file, compressed_stat = compressed_entry
+                
+                compressed_info.update({
+                    'has_compressed_version': True,
+                    'compressed_size': compressed_stat.st_size,
+                    'compressed_path': self._relative_path(compressed_file),
+                    'compression_ratio': round((1 - compressed_stat.st_size / original_size) * 100, 1) if original_size > 0 else 0
+                })
         
         except Exception as e:
             print(f"⚠️ Error checking compressed audio for {file_path}: {e}")
         
         return compressed_info
     
+    def _get_sibling_index(self, parent_dir: str) -> Dict:
+        """
+        List the transcriptions/ and compressed/ siblings of a directory once.
+        
+        All MP3s in the same seminar directory share these listings, so each
+        directory is read once per cache period instead of once per file.
+        
+        Returns:
+            Dictionary with 'transcriptions' (stem -> (path string, stat)),
+            'compressed' (filename -> (path string, stat)) and 'legacy_cache' ((path string, stat) list)
+        """
+        cache_key = parent_dir
+        sibling_index = self._sibling_cache.get(cache_key)
+        if sibling_index and (datetime.now() - sibling_index['timestamp']).total_seconds() < self._cache_ttl:
+            return sibling_index
+        
+        sibling_index = {
+            'transcriptions': {},
+            'compressed': {},
+            'legacy_cache': [],
+            'timestamp': datetime.now()
+        }
+        
+        transcriptions_dir = os.path.join(parent_dir, 'transcriptions')
+        for entry in self._scandir(transcriptions_dir):
+            if entry.name.endswith('.json') and not entry.is_dir():
+                sibling_index['transcriptions'][entry.name[:-len('.json')]] = (entry.path, entry.stat())
+        
+        for entry in self._scandir(os.path.join(transcriptions_dir, 'cache')):
+            if entry.name.endswith('.json'):
+                sibling_index['legacy_cache'].append((entry.path, entry.stat()))
+        
+        for entry in self._scandir(os.path.join(parent_dir, 'compressed')):
+            if not entry.is_dir():
+                sibling_index['compressed'][entry.name] = (entry.path, entry.stat())
+        
+        if not (sibling_index['transcriptions'] or sibling_index['legacy_cache'] or sibling_index['compressed']):
+            self._negative_dir_cache[cache_key] = sibling_index['timestamp']
+        
+        self._sibling_cache[cache_key] = sibling_index
+        return sibling_index
+    
+    def _has_no_sibling_dirs(self, parent_dir: str) -> bool:
+        """Check whether a directory was recently seen without transcriptions/ or compressed/."""
+        observed_at = self._negative_dir_cache.get(parent_dir)
+        return observed_at is not None and (datetime.now() - observed_at).total_seconds() < self._cache_ttl
+    
+    def _relative_path(self, path: str) -> str:
+        """Return a path relative to base_directory, or unchanged if it lies outside it."""
+        if self._base_dir_prefix is not None and path.startswith(self._base_dir_prefix):
+            return path[len(self._base_dir_prefix):]
+        return path
+    
+    @staticmethod
+    def _scandir(directory) -> List[os.DirEntry]:
+        """List a directory, treating a missing or unreadable directory as empty."""
+        try:
+            with os.scandir(directory) as entries:
+                return list(entries)
+        except OSError:
+            return []
+    
     async def _get_audio_duration_ffprobe(self, file_path: Path) -> Optional[float]:
         """
         Get audio duration using ffprobe.
@@ -391,31 +898,226 @@ class FileSystemScanner:
                 str(file_path)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0 and result.stdout.strip():
-                return float(result.stdout.strip())
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, ValueError, FileNotFoundError):
+            # Run ffprobe without blocking the event loop so concurrent probes overlap
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return None
+            
+            output = stdout.decode().strip()
+            if process.returncode == 0 and output:
+                return float(output)
+        except (ValueError, FileNotFoundError):
             pass
         
         return None
     
-    def _generate_file_id(self, file_path: Path) -> str:
+    async def _get_audio_duration_frame_scan(self, file_path: Path) -> Optional[float]:
+        """
+        Get audio duration by counting MP3 frames in a worker process.
+        
+        The frame walk is pure-Python CPU work, so it runs in a process pool
+        where several files can be scanned in parallel.
+        
+        Returns:
+            Duration in seconds, or None if failed
+        """
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, _count_mp3_frames_duration, str(file_path))
+    
+    @staticmethod
+    def _read_transcription_summary(file_path: str) -> Dict:
+        """
+        Read only the fields the status check needs from a transcription file.
+        
+        A completed transcription written by this project is recognised from
+        the first few KB without decoding the whole Deepgram response. The
+        probe is only a shortcut: any other key order or layout falls back to
+        a full parse, whose result _read_cached keeps for the file version.
+        
+        Returns:
+            Dictionary with 'completed', 'timestamp' and 'error'
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(_TRANSCRIPTION_HEAD_BYTES)
+        
+        result_match = _RESULT_TEXT_PATTERN.search(head)
+        if result_match and result_match.group(1) != b'"':
+            timestamp_match = _TIMESTAMP_PATTERN.search(head, 0, result_match.start())
+            if timestamp_match:
+                return {
+                    'completed': True,
+                    'timestamp': timestamp_match.group(1).decode('utf-8'),
+                    'error': None
+                }
+        
+        with open(file_path, 'rb') as f:
+            transcription_data = orjson.loads(f.read())
+        
+        # Check if transcription was successful
+        # Support both formats:
+        # 1. Cache format: { "result": { "text": "..." } }
+        # 2. Direct format: { "text": "..." } (from CLI output)
+        has_result_text = transcription_data.get('result') and transcription_data['result'].get('text')
+        has_direct_text = transcription_data.get('text') and transcription_data.get('raw_response')
+        
+        completed = bool(has_result_text or has_direct_text)
+        
+        return {
+            'completed': completed,
+            'timestamp': transcription_data.get('timestamp'),
+            'error': None if completed else transcription_data.get('error', 'Unknown error')
+        }
+    
+    @staticmethod
+    def _read_legacy_cache_summary(file_path: str) -> Dict:
+        """
+        Read the fields the status check needs from a legacy cache file.
+        
+        Returns:
+            Dictionary with 'audio_file', 'completed', 'timestamp' and 'error'
+        """
+        with open(file_path, 'rb') as f:
+            cache_data = orjson.loads(f.read())
+        completed = bool(cache_data.get('result') and cache_data['result'].get('text'))
+        
+        return {
+            'audio_file': cache_data.get('audio_file'),
+            'completed': completed,
+            'timestamp': cache_data.get('timestamp'),
+            'error': None if completed else cache_data.get('error', 'Unknown error')
+        }
+    
+    async def _read_cached(self, file_path: str, file_stat: os.stat_result, reader) -> Dict:
+        """
+        Run a file reader in a worker thread, reusing the previous result
+        while the file's mtime and size are unchanged.
+        """
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _file_summaries.get(file_path)
+        if cached and cached[0] == file_key:
+            return cached[1]
+        
+        summary = await asyncio.to_thread(reader, file_path)
+        _file_summaries[file_path] = (file_key, summary)
+        return summary
+    
+    def _generate_file_id(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> str:
         """Generate a unique ID for a file based on its path and metadata."""
-        file_info = f"{file_path}_{file_path.stat().st_mtime}_{file_path.stat().st_size}"
-        return hashlib.md5(file_info.encode()).hexdigest()[:12]
+        return generate_file_id(file_path, file_stat)
     
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid."""
-        if cache_key not in self._cache_timestamps:
-            return False
+        # Scan results are only reused while the watcher invalidates them on
+        # change; without it nothing would notice a job writing a transcription
+        return cache_key in self._cache_timestamps and self._is_watched(cache_key)
+    
+    def _is_watched(self, directory: str) -> bool:
+        """Check whether a directory lies under one watched by the filesystem observer."""
+        return any(
+            directory == watched or directory.startswith(os.path.join(watched, ''))
+            for watched in self._watched_directories
+        )
+    
+    def _drop_unwatched_listings(self, directory: str):
+        """
+        Forget the sibling listings under a directory that is not watched.
         
-        cache_age = (datetime.now() - self._cache_timestamps[cache_key]).total_seconds()
-        return cache_age < self._cache_ttl
+        Without a watcher, each scan lists transcriptions/ and compressed/
+        again, so new transcriptions show up on the next scan. Within one scan
+        the listings are still shared by all files of a directory.
+        
+        Args:
+            directory: Absolute path of the scanned directory
+        """
+        if self._is_watched(directory):
+            return
+        
+        prefix = os.path.join(directory, '')
+        for cache in (self._sibling_cache, self._negative_dir_cache):
+            for cache_key in list(cache):
+                cache_path = os.path.abspath(cache_key)
+                if cache_path == directory or cache_path.startswith(prefix):
+                    cache.pop(cache_key, None)
+    
+    def _watch_directory(self, directory: str):
+        """
+        Start watching a scanned directory for changes if watchdog is available.
+        
+        Args:
+            directory: Absolute path of the scanned directory
+        """
+        if Observer is None or self._is_watched(directory):
+            return
+        
+        try:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+            self._observer.schedule(
+                _ScanCacheInvalidator(self, asyncio.get_running_loop()), directory, recursive=True
+            )
+            self._watched_directories.append(directory)
+        except OSError as e:
+            print(f"⚠️ Could not watch {directory} for changes, rescanning on every request instead: {e}")
+    
+    def _invalidate_path(self, path: str):
+        """
+        Drop cached data affected by a change to a path.
+        
+        Runs on the event loop, scheduled there by the watcher's event
+        handler, so it never races with a scan using the caches.
+        """
+        self._invalidation_count += 1
+        
+        # Scan results for any directory containing the path
+        for cache_key in list(self._directory_cache):
+            if path.startswith(os.path.join(cache_key, '')):
+                self._directory_cache.pop(cache_key, None)
+                self._cache_timestamps.pop(cache_key, None)
+        
+        # Sibling listings of the seminar directory: a change can be in the
+        # directory itself, in transcriptions/ or compressed/, or in transcriptions/cache/
+        affected_dirs = set()
+        parent = path
+        for _ in range(3):
+            parent = os.path.dirname(parent)
+            affected_dirs.add(parent)
+        
+        for cache in (self._sibling_cache, self._negative_dir_cache):
+            for cache_key in list(cache):
+                if os.path.abspath(cache_key) in affected_dirs:
+                    cache.pop(cache_key, None)
+    
+    def close(self):
+        """Stop the filesystem watcher and the worker processes, if they were started."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            self._watched_directories.clear()
+        
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown()
+            self._cpu_pool = None
     
     def clear_cache(self):
         """Clear the directory cache."""
         self._directory_cache.clear()
         self._cache_timestamps.clear()
+        self._sibling_cache.clear()
+        self._negative_dir_cache.clear()
 
 
 # Validation and error handling functions for task 2.3 (optional)
@@ -426,10 +1128,19 @@ class FileSystemValidator:
     """
     
     @staticmethod
-    def check_directory_permissions(directory_path: str) -> Dict:
+    def check_directory_permissions(directory_path: str, verify_actual: bool = False) -> Dict:
         """
         Check directory access permissions.
         
+        Permissions are checked with os.access, without listing the directory
+        or writing to it.
+        
+        Args:
+            directory_path: Path to the directory to check
+            verify_actual: Also create and remove a temporary file to confirm
+                writes really succeed (e.g. on network mounts where os.access
+                can be wrong)
+            
         Returns:
             Dictionary with permission status
         """
@@ -437,36 +1148,40 @@ class FileSystemValidator:
         
         result = {
             'path': str(directory),
-            'exists': directory.exists(),
-            'is_directory': directory.is_dir() if directory.exists() else False,
+            'exists': False,
+            'is_directory': False,
             'readable': False,
             'writable': False,
             'executable': False,
             'errors': []
         }
         
-        if not directory.exists():
+        try:
+            directory_stat = directory.stat()
+        except OSError:
             result['errors'].append("Directory does not exist")
             return result
         
-        if not directory.is_dir():
+        result['exists'] = True
+        result['is_directory'] = S_ISDIR(directory_stat.st_mode)
+        if not result['is_directory']:
             result['errors'].append("Path is not a directory")
             return result
         
-        try:
-            # Test read permission
-            list(directory.iterdir())
-            result['readable'] = True
-        except PermissionError:
+        result['readable'] = os.access(directory, os.R_OK)
+        if not result['readable']:
             result['errors'].append("No read permission")
         
-        try:
-            # Test write permission by creating a temporary file
-            test_file = directory / ".temp_permission_test"
-            test_file.touch()
-            test_file.unlink()
-            result['writable'] = True
-        except (PermissionError, OSError):
+        result['writable'] = os.access(directory, os.W_OK)
+        if result['writable'] and verify_actual:
+            try:
+                # Test write permission by creating a temporary file
+                test_file = directory / ".temp_permission_test"
+                test_file.touch()
+                test_file.unlink()
+            except OSError:
+                result['writable'] = False
+        if not result['writable']:
             result['errors'].append("No write permission")
         
         # Check execute permission (ability to traverse)
@@ -477,10 +1192,17 @@ class FileSystemValidator:
         return result
     
     @staticmethod
-    def validate_audio_format(file_path: str) -> Dict:
+    def validate_audio_format(file_path: str, strict: bool = False) -> Dict:
         """
         Validate audio file format.
         
+        By default the file is accepted on its extension plus the MP3
+        signature in its first bytes (an ID3 tag or an MPEG frame sync).
+        
+        Args:
+            file_path: Path to the audio file
+            strict: Probe the container with ffprobe instead of checking the signature
+            
         Returns:
             Dictionary with validation results
         """
@@ -501,6 +1223,21 @@ class FileSystemValidator:
             result['errors'].append("File is not an MP3")
             return result
         
+        if not strict:
+            try:
+                with open(file_path, 'rb') as f:
+                    head = f.read(3)
+            except OSError as e:
+                result['errors'].append(f"Could not read file: {e}")
+                return result
+            
+            if head == b'ID3' or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+                result['is_valid'] = True
+                result['format'] = 'mp3'
+            else:
+                result['errors'].append("File does not start with an MP3 header")
+            return result
+        
         try:
             # Use ffprobe to validate the file
             cmd = [
@@ -548,8 +1285,7 @@ class FileSystemValidator:
             return result
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            data = orjson.loads(file_path.read_bytes())
             
             # Check required fields
             required_fields = ['audio_file', 'service', 'timestamp', 'result']
@@ -566,7 +1302,7 @@ class FileSystemValidator:
             if not result['errors']:
                 result['is_valid'] = True
         
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             result['errors'].append(f"Invalid JSON: {e}")
         except Exception as e:
             result['errors'].append(f"Error reading file: {e}")
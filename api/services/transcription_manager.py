@@ -2,7 +2,12 @@
 
 import uuid
 import asyncio
-from typing import Dict, Optional
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 from fastapi import BackgroundTasks
@@ -15,9 +20,39 @@ from src.core.transcription_orchestrator import TranscriptionOrchestrator
 from src.utils.config import ConfigManager
 from src.services.transcription_client import TranscriptionConfig
 
+from .file_id import FileIdIndex, generate_file_id
 from ..models import TranscriptionRequest, TranscriptionProgress, TranscriptionStatus
 from ..config import Settings
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _JobState:
+    """
+    Progress of a transcription job as tracked by the manager.
+    
+    Progress is updated many times per job, so it is kept in a slotted
+    dataclass and only turned into a TranscriptionProgress model when it
+    is returned through the API.
+    """
+    __slots__ = ('job_id', 'status', 'progress', 'message', 'error')
+    
+    job_id: str
+    status: TranscriptionStatus
+    progress: float
+    message: str
+    error: Optional[str]
+    
+    def to_model(self) -> TranscriptionProgress:
+        """Return the job state as an API model, without re-validating it."""
+        return TranscriptionProgress.model_construct(
+            job_id=self.job_id,
+            status=self.status,
+            progress=self.progress,
+            message=self.message,
+            error=self.error
+        )
 
 
 class WebTranscriptionManager:
@@ -26,60 +61,105 @@ class WebTranscriptionManager:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.config_manager = ConfigManager(settings.config_file)
-        self.active_jobs: Dict[str, TranscriptionProgress] = {}
+        self.active_jobs: Dict[str, _JobState] = {}
+        # Monotonic finish time of each completed or failed job, used to drop
+        # it from active_jobs once its status has been kept long enough
+        self._finished_at: Dict[str, float] = {}
 
         self.max_concurrent_jobs = 3  # Limit concurrent transcriptions
-        self.job_queue = asyncio.Queue()
+        self.job_queue = asyncio.Queue(maxsize=settings.max_queued_transcriptions)
         self.processing_jobs = set()
+        # Running job tasks, so they can be cancelled and awaited on shutdown
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._file_index = FileIdIndex(settings.audio_directory)
+        # Released when a job finishes, so the queue processor wakes up as
+        # soon as a slot is free instead of polling
+        self._admission = asyncio.Semaphore(self.max_concurrent_jobs)
+        
+        # Each running job has at most one blocking step (FFmpeg, writing the
+        # result) in flight, so one thread per job slot is enough, and these
+        # steps never wait behind other to_thread work in the API
+        self._transcription_executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_jobs,
+            thread_name_prefix="transcribe"
+        )
         
         # Initialize orchestrator
         self.orchestrator = TranscriptionOrchestrator(
             config_manager=self.config_manager,
             output_dir=settings.audio_directory / "transcriptions",
             verbose=True,
-            fail_fast=False
+            fail_fast=False,
+            executor=self._transcription_executor
         )
         
         # Start job processor
-        asyncio.create_task(self._process_job_queue())
+        self._queue_task = asyncio.create_task(self._process_job_queue())
     
     async def start_transcription(self, request: TranscriptionRequest, background_tasks: BackgroundTasks) -> str:
-        """Start a new transcription job."""
+        """
+        Start a new transcription job.
+        
+        Raises:
+            asyncio.QueueFull: If the job queue is already full
+        """
+        self._prune_finished_jobs()
         job_id = str(uuid.uuid4())
         
+        # Add to job queue, failing fast rather than letting the backlog grow
+        self.job_queue.put_nowait((job_id, request))
+        
         # Create initial job status
-        job_status = TranscriptionProgress(
+        job_status = _JobState(
             job_id=job_id,
             status=TranscriptionStatus.PROCESSING,
             progress=0.0,
-            message="Queued for transcription..."
+            message="Queued for transcription...",
+            error=None
         )
         
         self.active_jobs[job_id] = job_status
-        
-        # Add to job queue
-        await self.job_queue.put((job_id, request))
         await self._broadcast_progress(job_id)
         
         return job_id
     
     async def get_job_status(self, job_id: str) -> Optional[TranscriptionProgress]:
         """Get the status of a transcription job."""
-        return self.active_jobs.get(job_id)
+        job = self.active_jobs.get(job_id)
+        return job.to_model() if job else None
     
     async def cancel_job(self, job_id: str) -> bool:
-        """Cancel a transcription job."""
+        """
+        Cancel a transcription job.
+        
+        A running job's task is cancelled. A queued job is skipped when the
+        queue processor reaches it.
+        """
         if job_id in self.active_jobs:
             job = self.active_jobs[job_id]
             if job.status == TranscriptionStatus.PROCESSING:
                 job.status = TranscriptionStatus.ERROR
                 job.message = "Job cancelled by user"
+                task = self._tasks.get(job_id)
+                if task:
+                    task.cancel()
+                else:
+                    self._finished_at[job_id] = time.monotonic()
                 return True
         return False
     
+    async def shutdown(self):
+        """Cancel the queue processor and running jobs and wait for them to stop."""
+        tasks = [self._queue_task, *self._tasks.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._transcription_executor.shutdown(wait=False)
+    
     async def list_active_jobs(self) -> Dict[str, TranscriptionProgress]:
         """List all active transcription jobs."""
-        return self.active_jobs.copy()
+        self._prune_finished_jobs()
+        return {job_id: job.to_model() for job_id, job in self.active_jobs.items()}
     
     async def get_queue_status(self) -> dict:
         """Get transcription queue status."""
@@ -92,35 +172,81 @@ class WebTranscriptionManager:
     
     async def _process_job_queue(self):
         """Process jobs from the queue with concurrency limits."""
+        retry_delay = 0.0
         while True:
+            # Whether this iteration holds an admission slot not yet handed
+            # to a job's done callback
+            admitted = False
             try:
                 # Wait for a job to be available
                 job_id, request = await self.job_queue.get()
                 
                 # Wait if we're at max concurrent jobs
-                while len(self.processing_jobs) >= self.max_concurrent_jobs:
-                    await asyncio.sleep(1)
+                await self._admission.acquire()
+                admitted = True
+                
+                # Skip jobs cancelled while they were waiting
+                job = self.active_jobs.get(job_id)
+                if not job or job.status != TranscriptionStatus.PROCESSING:
+                    self._admission.release()
+                    admitted = False
+                    continue
                 
-                # Start processing the job
+                # Start processing the job. Cleanup runs as a done callback,
+                # so it also happens for a task cancelled before it started
                 self.processing_jobs.add(job_id)
-                asyncio.create_task(self._run_transcription_with_cleanup(job_id, request))
+                task = asyncio.create_task(self._run_transcription(job_id, request))
+                task.add_done_callback(partial(self._on_job_done, job_id))
+                admitted = False
+                self._tasks[job_id] = task
+                retry_delay = 0.0
                 
-            except Exception as e:
-                print(f"❌ Error in job queue processor: {e}")
-                await asyncio.sleep(5)  # Wait before retrying
+            except Exception:
+                if admitted:
+                    self.processing_jobs.discard(job_id)
+                    self._admission.release()
+                
+                # Logged once per backoff step, so a persistent failure
+                # writes at most one traceback every 30 seconds
+                logger.exception("Error in job queue processor (retry delay %.0fs)", retry_delay)
+                
+                # Retry at once after a first error while jobs are waiting,
+                # then back off exponentially up to 30 seconds
+                if retry_delay == 0.0 and self.job_queue.qsize() > 0:
+                    retry_delay = 1.0
+                    continue
+                retry_delay = min(max(retry_delay * 2, 1.0), 30.0)
+                await asyncio.sleep(retry_delay)
     
-    async def _run_transcription_with_cleanup(self, job_id: str, request: TranscriptionRequest):
-        """Run transcription and clean up processing set."""
-        try:
-            await self._run_transcription(job_id, request)
-        finally:
-            self.processing_jobs.discard(job_id)
+    def _on_job_done(self, job_id: str, task: asyncio.Task):
+        """Release a finished or cancelled job's slot and clean up processing set."""
+        self._tasks.pop(job_id, None)
+        self.processing_jobs.discard(job_id)
+        self._admission.release()
+        self._finished_at[job_id] = time.monotonic()
+        
+        if not task.cancelled() and task.exception() is not None:
+            print(f"❌ Transcription job {job_id} failed: {task.exception()}")
+    
+    def _prune_finished_jobs(self):
+        """Forget jobs that finished more than finished_job_ttl_seconds ago."""
+        cutoff = time.monotonic() - self.settings.finished_job_ttl_seconds
+        expired = [job_id for job_id, finished_at in self._finished_at.items() if finished_at < cutoff]
+        for job_id in expired:
+            del self._finished_at[job_id]
+            self.active_jobs.pop(job_id, None)
     
     async def _broadcast_progress(self, job_id: str):
         """Log job progress (WebSocket functionality removed for simplicity)."""
-        if job_id in self.active_jobs:
-            job = self.active_jobs[job_id]
-            print(f"📊 Job {job_id}: {job.status.value} - {job.progress}% - {job.message}")
+        self._log_progress(job_id)
+    
+    def _log_progress(self, job_id: str):
+        """Log a job's progress at debug level."""
+        # Called on every progress step, so the message is only formatted
+        # when debug logging is enabled
+        job = self.active_jobs.get(job_id)
+        if job is not None:
+            logger.debug("Job %s: %s - %s%% - %s", job_id, job.status.value, job.progress, job.message)
     
     async def _run_transcription(self, job_id: str, request: TranscriptionRequest):
         """Run the actual transcription process."""
@@ -138,11 +264,7 @@ class WebTranscriptionManager:
             await self._broadcast_progress(job_id)
             
             # Find the audio file
-            audio_file = None
-            for file_path in Path(self.settings.audio_directory).glob("*.mp3"):
-                if self._generate_file_id(file_path) == request.file_id:
-                    audio_file = file_path
-                    break
+            audio_file = self._file_index.find(request.file_id)
             
             if not audio_file:
                 raise Exception(f"Audio file not found for ID: {request.file_id}")
@@ -157,18 +279,15 @@ class WebTranscriptionManager:
             job.progress = 30.0
             await self._broadcast_progress(job_id)
             
-            # Run transcription using existing orchestrator
-            # Note: This is a synchronous call, so we'll simulate progress updates
-            asyncio.create_task(self._simulate_progress_updates(job_id))
-            
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.orchestrator.run_transcription_workflow,
+            # Run transcription using existing orchestrator, which reports
+            # its own progress as each file moves through the workflow
+            result = await self.orchestrator.run_transcription_workflow(
                 audio_file.parent,
                 request.service,
                 request.output_formats,
                 [],  # glossary_files
-                request.compress_audio
+                request.compress_audio,
+                progress_callback=self._make_progress_callback(job_id)
             )
             
             if result.get('success', False):
@@ -189,33 +308,29 @@ class WebTranscriptionManager:
                 job.error = str(e)
                 await self._broadcast_progress(job_id)
     
-    async def _simulate_progress_updates(self, job_id: str):
-        """Simulate progress updates during transcription."""
-        if job_id not in self.active_jobs:
-            return
-        
-        job = self.active_jobs[job_id]
-        progress_steps = [
-            (40.0, "Uploading audio to transcription service..."),
-            (50.0, "Transcription in progress..."),
-            (70.0, "Processing speaker diarization..."),
-            (85.0, "Generating output formats..."),
-            (95.0, "Finalizing transcription...")
-        ]
+    def _make_progress_callback(self, job_id: str) -> Callable[[float, str], None]:
+        """
+        Build the orchestrator progress callback for a job.
         
-        for progress, message in progress_steps:
-            if job.status != TranscriptionStatus.PROCESSING:
-                break
+        The orchestrator's fraction of work done is mapped onto the 30-95%
+        range left between preparation and completion. Updates that neither
+        change the message nor advance progress by 5% are not broadcast.
+        """
+        def on_progress(fraction: float, message: str) -> None:
+            job = self.active_jobs.get(job_id)
+            if not job or job.status != TranscriptionStatus.PROCESSING:
+                return
             
-            await asyncio.sleep(2)  # Wait 2 seconds between updates
+            progress = round(30.0 + fraction * 65.0, 1)
+            if message == job.message and progress - job.progress < 5.0:
+                return
             
-            if job_id in self.active_jobs and job.status == TranscriptionStatus.PROCESSING:
-                job.progress = progress
-                job.message = message
-                await self._broadcast_progress(job_id)
+            job.progress = progress
+            job.message = message
+            self._log_progress(job_id)
+        
+        return on_progress
     
     def _generate_file_id(self, file_path: Path) -> str:
         """Generate file ID matching the file manager."""
-        import hashlib
-        file_info = f"{file_path}_{file_path.stat().st_mtime}_{file_path.stat().st_size}"
-        return hashlib.md5(file_info.encode()).hexdigest()[:12]
\ No newline at end of file
+        return generate_file_id(file_path)
\ No newline at end of file
@@ -1,12 +1,14 @@
 """TranscriptionService class for web manager integration."""
 
 import asyncio
-import json
+import os
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
+import orjson
+
 # Import from existing transcription system
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -32,6 +34,11 @@ from ..models import (
 )
 from ..config import Settings
 
+# Status details parsed from each transcription file, keyed by the file's
+# (mtime_ns, size) so a rewritten file is parsed again. Entries are a few
+# fields each, so the cache is not bounded.
+_status_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 class TranscriptionService:
     """Service class for handling transcription operations in the web manager."""
@@ -50,6 +57,10 @@ class TranscriptionService:
         
         # Setup audio processing for compression
         self.orchestrator.setup_audio_processing(enable_compression=True)
+        
+        # The config file is only read once, so the transcription config
+        # built from it does not change either
+        self.transcription_config = self._build_transcription_config()
     
     async def transcribe_audio(self, audio_file_path: Path, compress_audio: bool = True) -> APITranscriptionResult:
         """
@@ -67,7 +78,7 @@ class TranscriptionService:
             output_manager.create_output_structure()
             
             # Get transcription configuration
-            transcription_config = self._build_transcription_config()
+            transcription_config = self.transcription_config
             
             # Create transcription client
             service_factory = self.orchestrator.service_factory
@@ -79,15 +90,13 @@ class TranscriptionService:
             
             if compress_audio and self.orchestrator.audio_processor:
                 try:
-                    # Compress audio for transcription and storage
-                    compressed_file = self.orchestrator.audio_processor.compress_audio(
-                        audio_file_path, force=True
-                    )
-                    
-                    # Move compressed file to correct location
+                    # Compress audio for transcription and storage in a worker
+                    # thread, so other requests are served while FFmpeg runs
                     compressed_audio_path = output_manager.get_compressed_audio_path()
-                    import shutil
-                    shutil.move(str(compressed_file), str(compressed_audio_path))
+                    await asyncio.to_thread(
+                        self.orchestrator.audio_processor.compress_audio_to,
+                        audio_file_path, compressed_audio_path, True
+                    )
                     
                     # Use compressed file for transcription
                     file_to_transcribe = compressed_audio_path
@@ -107,10 +116,13 @@ class TranscriptionService:
                 audio_file_path, result, transcription_config, processing_time
             )
             
-            # Save transcription to correct location
+            # Save transcription to correct location. The raw response of a
+            # long recording runs to megabytes, so encode and write it in a
+            # worker thread to keep the event loop responsive
             transcription_path = output_manager.get_transcription_path()
-            with open(transcription_path, 'w', encoding='utf-8') as f:
-                json.dump(corrected_deepgram_response, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(
+                self._write_transcription_file, transcription_path, corrected_deepgram_response
+            )
             
             # Return API result
             return APITranscriptionResult(
@@ -150,24 +162,8 @@ class TranscriptionService:
                 'error': None
             }
             
-            if transcription_path.exists():
-                try:
-                    # Load transcription data to get status details
-                    with open(transcription_path, 'r', encoding='utf-8') as f:
-                        transcription_data = json.load(f)
-                    
-                    # Check if this is a valid transcription result
-                    if 'result' in transcription_data and transcription_data['result'].get('text'):
-                        status_info['status'] = 'completed'
-                        status_info['last_attempt'] = transcription_data.get('timestamp')
-                        status_info['processing_time'] = transcription_data.get('result', {}).get('processing_time')
-                    else:
-                        status_info['status'] = 'failed'
-                        status_info['error'] = 'Invalid transcription data'
-                        
-                except (json.JSONDecodeError, KeyError) as e:
-                    status_info['status'] = 'failed'
-                    status_info['error'] = f'Corrupted transcription file: {str(e)}'
+            if status_info['exists']:
+                status_info.update(self._read_transcription_status(transcription_path))
             
             return status_info
             
@@ -182,6 +178,45 @@ class TranscriptionService:
                 'processing_time': None
             }
     
+    def _read_transcription_status(self, transcription_path: Path) -> Dict[str, Any]:
+        """
+        Read the status details of an existing transcription file.
+        
+        Status polling calls this repeatedly for the same files, and parsing
+        a multi-megabyte transcription is by far its most expensive part, so
+        the details are cached until the file's mtime or size changes.
+        """
+        stat_result = transcription_path.stat()
+        file_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _status_cache.get(transcription_path)
+        if cached and cached[0] == file_key:
+            return cached[1]
+        
+        try:
+            transcription_data = orjson.loads(transcription_path.read_bytes())
+            
+            # Check if this is a valid transcription result
+            if 'result' in transcription_data and transcription_data['result'].get('text'):
+                details = {
+                    'status': 'completed',
+                    'last_attempt': transcription_data.get('timestamp'),
+                    'processing_time': transcription_data.get('result', {}).get('processing_time')
+                }
+            else:
+                details = {
+                    'status': 'failed',
+                    'error': 'Invalid transcription data'
+                }
+        
+        except (orjson.JSONDecodeError, KeyError) as e:
+            details = {
+                'status': 'failed',
+                'error': f'Corrupted transcription file: {str(e)}'
+            }
+        
+        _status_cache[transcription_path] = (file_key, details)
+        return details
+    
     async def retry_transcription(self, audio_file_path: Path, compress_audio: bool = True) -> APITranscriptionResult:
         """
         Retry transcription for a failed audio file.
@@ -218,8 +253,7 @@ class TranscriptionService:
             if not transcription_path.exists():
                 return None
             
-            with open(transcription_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(transcription_path.read_bytes())
                 
         except Exception as e:
             print(f"Error loading transcription data: {e}")
@@ -237,9 +271,12 @@ class TranscriptionService:
             # Ensure output directory exists
             transcription_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save with proper formatting
-            with open(transcription_path, 'w', encoding='utf-8') as f:
-                json.dump(corrected_response, f, indent=2, ensure_ascii=False)
+            # Save with proper formatting, skipping the write if nothing changed
+            content = orjson.dumps(corrected_response, option=orjson.OPT_INDENT_2)
+            if (transcription_path.exists() and transcription_path.stat().st_size == len(content)
+                    and transcription_path.read_bytes() == content):
+                return True
+            self._replace_file(transcription_path, content)
             
             return True
             
@@ -247,6 +284,26 @@ class TranscriptionService:
             print(f"Error saving corrected transcription: {e}")
             return False
     
+    def _write_transcription_file(self, transcription_path: Path, data: Dict[str, Any]) -> None:
+        """Encode transcription data as indented JSON and write it to disk."""
+        self._replace_file(transcription_path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    
+    def _replace_file(self, path: Path, content: bytes) -> None:
+        """
+        Write content to path atomically.
+        
+        The content goes to a temporary file in the same directory that is
+        then renamed over the target, so readers never see a partially
+        written transcription.
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def _create_corrected_deepgram_response(
         self, 
         audio_file_path: Path, 
@@ -261,6 +318,9 @@ class TranscriptionService:
         # Convert raw Deepgram response to our structured format
         raw_response = transcription_result.raw_response
         
+        # The response and its initial corrections are created together
+        timestamp = datetime.now().isoformat()
+        
         # Create the corrected response structure
         corrected_response = {
             "audio_file": str(audio_file_path),
@@ -273,7 +333,7 @@ class TranscriptionService:
                 "language_code": config.language_code,
                 "max_speakers": config.max_speakers
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "result": {
                 "text": transcription_result.text,
                 "speakers": [
@@ -294,7 +354,7 @@ class TranscriptionService:
             # Initialize corrections structure (empty initially)
             "corrections": {
                 "version": 1,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "speaker_names": {},  # Will store custom speaker name mappings
                 "word_corrections": []  # Will store individual word corrections
             }
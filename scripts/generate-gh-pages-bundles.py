@@ -8,20 +8,28 @@ Each bundle includes:
 - A standalone HTML file with react-transcript-editor preloaded
 """
 
-import json
+import html
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 import base64
 
+import orjson
+
+from pages_io import write_if_changed
+
 # HTML template for standalone transcript viewer
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Transcript</title>
+    <title>{title_html} - Transcript</title>
     <style>
         body {{
             margin: 0;
@@ -116,7 +124,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             const transcriptData = {transcript_json};
             
             // Media URL (relative to this HTML file)
-            const mediaUrl = './{audio_filename}';
+            const mediaUrl = {media_url_js};
             
             // Render the transcript editor
             function App() {{
@@ -126,8 +134,8 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                     isEditable: false,
                     spellCheck: false,
                     sttJsonType: 'deepgram',
-                    title: '{title}',
-                    fileName: '{audio_filename}',
+                    title: {title_js},
+                    fileName: {audio_filename_js},
                     mediaType: 'audio'
                 }});
             }}
@@ -157,14 +165,39 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 '''
 
 
+def to_script_literal(value) -> str:
+    """Serialize a value as a JavaScript literal that is safe inside a <script> element."""
+    literal = orjson.dumps(value).decode('utf-8')
+    # orjson writes non-ASCII characters as-is; escape the two line separators
+    # that older JavaScript engines reject inside string literals
+    return literal.replace('</', '<\\/').replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+# Directories that never contain lecture transcriptions; pruning them keeps the
+# walk proportional to the audio folders rather than the whole checkout
+SKIP_DIRS = {'.git', 'node_modules', 'gh-pages-output', 'cache', 'temp'}
+
+# Bundles generated concurrently; enough to overlap file I/O without
+# exhausting file descriptors
+BUNDLE_WORKERS = 8
+
+# Keeps progress lines from different bundle threads from interleaving
+print_lock = threading.Lock()
+
+
 def find_transcription_files(base_dir: Path) -> List[Path]:
     """Find all transcription JSON files."""
     transcriptions = []
-    for json_file in base_dir.rglob("transcriptions/*.json"):
-        # Skip cache and temp directories
-        if "cache" not in json_file.parts and "temp" not in json_file.parts:
-            transcriptions.append(json_file)
-    return transcriptions
+    for root, dirs, files in os.walk(base_dir):
+        # Skip cache, temp and build directories without descending into them
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        if os.path.basename(root) != "transcriptions":
+            continue
+        root_path = Path(root)
+        for name in files:
+            if name.endswith(".json"):
+                transcriptions.append(root_path / name)
+    return sorted(transcriptions)
 
 
 def get_seminar_group(transcription_path: Path, base_dir: Path) -> str:
@@ -182,24 +215,36 @@ def get_seminar_group(transcription_path: Path, base_dir: Path) -> str:
         return transcription_path.parent.parent.name
 
 
+@lru_cache(maxsize=None)
+def compressed_audio_index(seminar_dir: Path) -> Dict[str, Path]:
+    """
+    Map MP3 filenames to compressed audio files under a seminar directory.
+    
+    The directory is walked once and shared by all of its transcriptions.
+    Files directly in compressed/ take precedence over ones found deeper.
+    """
+    index = {}
+    nested = {}
+    for root, dirs, files in os.walk(seminar_dir):
+        dirs.sort()
+        root_path = Path(root)
+        if "compressed" not in root_path.parts:
+            continue
+        target = index if root_path == seminar_dir / "compressed" else nested
+        for name in sorted(files):
+            if name.endswith(".mp3"):
+                target.setdefault(name, root_path / name)
+    for name, path in nested.items():
+        index.setdefault(name, path)
+    return index
+
+
 def find_compressed_audio(transcription_path: Path) -> Optional[Path]:
     """Find compressed audio file corresponding to transcription."""
-    # Get the base filename without extension
-    base_name = transcription_path.stem
-    
-    # Look in compressed/ directory at same level as transcriptions/
-    compressed_dir = transcription_path.parent.parent / "compressed"
-    if compressed_dir.exists():
-        mp3_path = compressed_dir / f"{base_name}.mp3"
-        if mp3_path.exists():
-            return mp3_path
-    
-    # Fallback: look for any .mp3 with same base name
-    for mp3_file in transcription_path.parent.parent.rglob(f"{base_name}.mp3"):
-        if "compressed" in mp3_file.parts or mp3_file.parent.name == "compressed":
-            return mp3_file
-    
-    return None
+    # Look in compressed/ directory at same level as transcriptions/, falling
+    # back to any compressed .mp3 with the same base name
+    index = compressed_audio_index(transcription_path.parent.parent)
+    return index.get(f"{transcription_path.stem}.mp3")
 
 
 def extract_speaker_number(speaker_identifier) -> int:
@@ -236,18 +281,20 @@ def extract_speaker_number(speaker_identifier) -> int:
 
 def load_transcript_json(transcription_path: Path) -> Dict:
     """Load and transform transcript JSON for react-transcript-editor."""
-    with open(transcription_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
+    return transform_transcript_json(orjson.loads(transcription_path.read_bytes()), transcription_path)
+
+
+def transform_transcript_json(data: Dict, transcription_path: Path) -> Dict:
+    """Transform already parsed transcript JSON for react-transcript-editor."""
     # Handle two possible formats:
     # 1. CorrectedDeepgramResponse format: raw_response at root
     # 2. Transcription cache format: raw_response nested under result
-    raw_response = data.get('raw_response') or data.get('result', {}).get('raw_response', {})
+    nested = data['result'] if isinstance(data.get('result'), dict) else {}
+    raw_response = data.get('raw_response') or nested.get('raw_response', {})
     
     if not raw_response or 'results' not in raw_response:
         # Try to get raw_response from result.raw_response if it exists
-        if 'result' in data and isinstance(data['result'], dict):
-            raw_response = data['result'].get('raw_response', {})
+        raw_response = nested.get('raw_response', {})
         
         if not raw_response or 'results' not in raw_response:
             raise ValueError(f"Invalid transcript format in {transcription_path}. Expected raw_response with results.")
@@ -256,30 +303,30 @@ def load_transcript_json(transcription_path: Path) -> Dict:
     alternative = channel['alternatives'][0]
     words = alternative.get('words', [])
     
-    # Transform words to format expected by react-transcript-editor
+    # Transform words to format expected by react-transcript-editor, collecting
+    # their speakers in the same pass
     transformed_words = []
+    word_speakers = set()
     for idx, word in enumerate(words):
+        text = word.get('word', '')
+        speaker = word.get('speaker', 0)
+        word_speakers.add(speaker)
         transformed_words.append({
             'start': word.get('start', 0),
             'end': word.get('end', 0),
-            'word': word.get('word', ''),
+            'word': text,
             'confidence': word.get('confidence', 0.9),
-            'punct': word.get('punctuated_word', word.get('word', '')),
+            'punct': word.get('punctuated_word', text),
             'index': idx,
-            'speaker': word.get('speaker', 0)
+            'speaker': speaker
         })
     
     # Get speakers list - handle both formats
-    speakers_list = data.get('speakers', []) or data.get('result', {}).get('speakers', [])
-    unique_speakers = sorted(set(w.get('speaker', 0) for w in words))
+    speakers_list = data.get('speakers', []) or nested.get('speakers', [])
     
     # Create a mapping from speaker identifiers to numbers for consistency
-    speaker_id_to_num = {}
-    next_speaker_num = 0
-    for speaker_id in unique_speakers:
-        if speaker_id not in speaker_id_to_num:
-            speaker_id_to_num[speaker_id] = next_speaker_num
-            next_speaker_num += 1
+    speaker_id_to_num = {speaker_id: num for num, speaker_id in enumerate(sorted(word_speakers))}
+    next_speaker_num = len(speaker_id_to_num)
     
     # Also map all speaker identifiers from speakers_list
     for seg in speakers_list:
@@ -310,12 +357,8 @@ def load_transcript_json(transcription_path: Path) -> Dict:
     # Transform speaker segments
     transformed_speakers = []
     for seg in speakers_list:
-        speaker_str = seg.get('speaker', 'Speaker 0')
-        # Use the mapping to get consistent speaker numbers
-        speaker_num = speaker_id_to_num.get(speaker_str, extract_speaker_number(speaker_str))
-        
         transformed_speakers.append({
-            'speaker': speaker_str,
+            'speaker': seg.get('speaker', 'Speaker 0'),
             'start_time': seg.get('start_time', 0),
             'end_time': seg.get('end_time', 0),
             'text': seg.get('text', ''),
@@ -323,15 +366,15 @@ def load_transcript_json(transcription_path: Path) -> Dict:
         })
     
     # Build transcript text - handle both formats
-    transcript_text = alternative.get('transcript', '') or data.get('text', '') or data.get('result', {}).get('text', '')
+    transcript_text = alternative.get('transcript', '') or data.get('text', '') or nested.get('text', '')
     
     # Get metadata - handle both formats
     audio_duration = (
         raw_response.get('metadata', {}).get('duration') or 
         data.get('audio_duration') or 
-        data.get('result', {}).get('audio_duration', 0)
+        nested.get('audio_duration', 0)
     )
-    confidence = data.get('confidence') or data.get('result', {}).get('confidence', 0.9)
+    confidence = data.get('confidence') or nested.get('confidence', 0.9)
     
     result = {
         'words': transformed_words,
@@ -346,35 +389,55 @@ def load_transcript_json(transcription_path: Path) -> Dict:
     }
     
     # Add speaker names if available - handle both formats
-    corrections = data.get('corrections') or data.get('result', {}).get('corrections', {})
+    corrections = data.get('corrections') or nested.get('corrections', {})
     if corrections and 'speaker_names' in corrections:
         result['speaker_names'] = corrections['speaker_names']
     
     return result
 
 
+def is_bundle_current(bundle_html: Path, sources: List[Path]) -> bool:
+    """Check whether a bundle was generated after all of its sources last changed."""
+    try:
+        bundle_mtime = bundle_html.stat().st_mtime
+        return all(source.stat().st_mtime <= bundle_mtime for source in sources)
+    except OSError:
+        return False
+
+
 def generate_bundle(transcription_path: Path, output_dir: Path, base_dir: Path) -> Tuple[str, str]:
     """
     Generate a bundle for a single transcription.
     
+    Bundles that are newer than their transcript, audio file and this script
+    are left as they are, so re-running only regenerates what changed.
+    
     Returns:
         (seminar_group, lecture_name) tuple
     """
-    # Load transcript data
-    transcript_data = load_transcript_json(transcription_path)
-    
-    # Find compressed audio
+    # Find compressed audio before parsing the transcript, which is skipped without it
     audio_path = find_compressed_audio(transcription_path)
     if not audio_path:
-        print(f"⚠️  Warning: No compressed audio found for {transcription_path}")
+        with print_lock:
+            print(f"⚠️  Warning: No compressed audio found for {transcription_path}")
         return None, None
     
     # Get seminar group and lecture name
     seminar_group = get_seminar_group(transcription_path, base_dir)
     lecture_name = transcription_path.stem
     
-    # Create output directory structure
     bundle_dir = output_dir / seminar_group / lecture_name
+    if is_bundle_current(bundle_dir / "index.html", [transcription_path, audio_path, Path(__file__)]):
+        with print_lock:
+            print(f"⏭️  Up to date: {seminar_group}/{lecture_name}")
+        return seminar_group, lecture_name
+    
+    # Read the transcript once: the raw bytes are copied into the bundle and
+    # the parsed data is embedded in the viewer
+    transcript_bytes = transcription_path.read_bytes()
+    transcript_data = transform_transcript_json(orjson.loads(transcript_bytes), transcription_path)
+    
+    # Create output directory structure
     bundle_dir.mkdir(parents=True, exist_ok=True)
     
     # Copy audio file
@@ -382,19 +445,25 @@ def generate_bundle(transcription_path: Path, output_dir: Path, base_dir: Path)
     shutil.copy2(audio_path, bundle_dir / audio_filename)
     
     # Copy transcript JSON (for reference)
-    shutil.copy2(transcription_path, bundle_dir / "transcript.json")
+    write_if_changed(bundle_dir / "transcript.json", transcript_bytes)
     
     # Generate HTML file
     html_content = HTML_TEMPLATE.format(
-        title=lecture_name,
-        transcript_json=json.dumps(transcript_data, indent=2),
-        audio_filename=audio_filename
+        title_html=html.escape(lecture_name),
+        title_js=to_script_literal(lecture_name),
+        transcript_json=to_script_literal(transcript_data),
+        media_url_js=to_script_literal(f"./{quote(audio_filename)}"),
+        audio_filename_js=to_script_literal(audio_filename)
     )
     
-    with open(bundle_dir / "index.html", 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Written last and atomically: a complete index.html marks the bundle as
+    # current, so an unchanged one is touched to record that it was checked
+    bundle_html = bundle_dir / "index.html"
+    if not write_if_changed(bundle_html, html_content.encode('utf-8')):
+        os.utime(bundle_html)
     
-    print(f"✅ Generated bundle: {seminar_group}/{lecture_name}")
+    with print_lock:
+        print(f"✅ Generated bundle: {seminar_group}/{lecture_name}")
     return seminar_group, lecture_name
 
 
@@ -417,27 +486,34 @@ def main():
     
     print(f"📝 Found {len(transcriptions)} transcription file(s)")
     
-    # Generate bundles
-    bundles = {}
-    for transcription_path in transcriptions:
+    # Generate bundles; they are independent and mostly file copies, so they
+    # are written in parallel by a small thread pool
+    def build(transcription_path: Path) -> Tuple[str, str]:
         try:
-            seminar_group, lecture_name = generate_bundle(transcription_path, output_dir, base_dir)
-            if seminar_group and lecture_name:
-                if seminar_group not in bundles:
-                    bundles[seminar_group] = []
-                bundles[seminar_group].append({
-                    'name': lecture_name,
-                    'path': f"{seminar_group}/{lecture_name}/index.html"
-                })
+            return generate_bundle(transcription_path, output_dir, base_dir)
         except Exception as e:
-            print(f"❌ Error processing {transcription_path}: {e}")
-            import traceback
-            traceback.print_exc()
+            with print_lock:
+                print(f"❌ Error processing {transcription_path}: {e}")
+                import traceback
+                traceback.print_exc()
+            return None, None
+    
+    with ThreadPoolExecutor(max_workers=BUNDLE_WORKERS) as executor:
+        results = list(executor.map(build, transcriptions))
+    
+    bundles = {}
+    for seminar_group, lecture_name in results:
+        if seminar_group and lecture_name:
+            if seminar_group not in bundles:
+                bundles[seminar_group] = []
+            bundles[seminar_group].append({
+                'name': lecture_name,
+                'path': f"{seminar_group}/{lecture_name}/index.html"
+            })
     
     # Save bundle manifest for index page generation
     manifest_path = output_dir / "bundles-manifest.json"
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(bundles, f, indent=2)
+    write_if_changed(manifest_path, orjson.dumps(bundles, option=orjson.OPT_INDENT_2))
     
     print(f"\n✅ Generated {sum(len(lectures) for lectures in bundles.values())} bundle(s)")
     print(f"📦 Manifest saved to {manifest_path}")
@@ -3,8 +3,15 @@
 Generate index page listing all seminars and lectures.
 """
 
-import json
+import html
+from itertools import groupby
 from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+
+import orjson
+
+from pages_io import write_if_changed
 
 INDEX_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
@@ -138,6 +145,28 @@ INDEX_TEMPLATE = '''<!DOCTYPE html>
         .stat strong {{
             color: #2c3e50;
         }}
+        
+        .search {{
+            width: 100%;
+            margin-top: 1rem;
+            padding: 0.75rem 1rem;
+            font-size: 1rem;
+            border: 1px solid #dcdde1;
+            border-radius: 4px;
+        }}
+        
+        .pagination {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 1rem 0;
+            color: #7f8c8d;
+        }}
+        
+        .pagination a {{
+            color: #3498db;
+            text-decoration: none;
+        }}
     </style>
 </head>
 <body>
@@ -153,10 +182,64 @@ INDEX_TEMPLATE = '''<!DOCTYPE html>
                     <strong>{total_lectures}</strong> Lecture{plural_lectures}
                 </div>
             </div>
+            <input type="search" id="search" class="search" placeholder="Search lectures..." oninput="filterLectures(this.value)">
         </header>
         
+        <div id="page-content">
         {seminar_sections}
+        {pagination}
+        </div>
+        
+        <div id="search-results" class="seminar-section" style="display: none"></div>
     </div>
+    <script>
+        // The search index covers every page. It is only fetched on the first
+        // search, and its text is lowercased when the site is generated, so
+        // filtering only compares strings on each keystroke
+        let lectureIndex = null;
+        
+        async function filterLectures(query) {{
+            const q = query.trim().toLowerCase();
+            const pageContent = document.getElementById('page-content');
+            const results = document.getElementById('search-results');
+            if (!q) {{
+                results.style.display = 'none';
+                pageContent.style.display = '';
+                return;
+            }}
+            if (lectureIndex === null) {{
+                lectureIndex = await fetch('lectures.min.json').then(function (response) {{
+                    return response.json();
+                }});
+            }}
+            // Ignore results for a query the user has already typed past
+            if (document.getElementById('search').value.trim().toLowerCase() !== q) {{
+                return;
+            }}
+            const items = document.createDocumentFragment();
+            for (const item of lectureIndex) {{
+                if (item.t.includes(q)) {{
+                    const row = document.createElement('div');
+                    row.className = 'lecture-item';
+                    const link = document.createElement('a');
+                    link.className = 'lecture-link';
+                    link.href = item.p;
+                    link.textContent = item.s + ' / ' + item.n;
+                    row.appendChild(link);
+                    items.appendChild(row);
+                }}
+            }}
+            if (!items.childNodes.length) {{
+                const empty = document.createElement('div');
+                empty.className = 'empty-state';
+                empty.textContent = 'No matching lectures';
+                items.appendChild(empty);
+            }}
+            results.replaceChildren(items);
+            results.style.display = '';
+            pageContent.style.display = 'none';
+        }}
+    </script>
 </body>
 </html>
 '''
@@ -174,61 +257,116 @@ LECTURE_ITEM_TEMPLATE = '''                <div class="lecture-item">
                 </div>
 '''
 
+PAGINATION_TEMPLATE = '''<nav class="pagination">
+            {prev_link}
+            <span>Page {page_number} of {page_count}</span>
+            {next_link}
+        </nav>'''
+
+# Lectures listed per index page; the rest go to page-2.html, page-3.html, ...
+PAGE_SIZE = 50
+
+
+def page_filename(page_number: int) -> str:
+    """Return the filename of an index page (the first page is index.html)."""
+    return "index.html" if page_number == 1 else f"page-{page_number}.html"
+
+
+def render_pagination(page_number: int, page_count: int) -> str:
+    """Render previous/next links between index pages."""
+    if page_count == 1:
+        return ''
+    prev_link = (f'<a href="{page_filename(page_number - 1)}">← Previous</a>'
+                 if page_number > 1 else '<span></span>')
+    next_link = (f'<a href="{page_filename(page_number + 1)}">Next →</a>'
+                 if page_number < page_count else '<span></span>')
+    return PAGINATION_TEMPLATE.format(
+        prev_link=prev_link,
+        page_number=page_number,
+        page_count=page_count,
+        next_link=next_link
+    )
+
+
+def render_seminar_sections(page_lectures: List[Tuple[str, Dict]]) -> str:
+    """Render the seminar sections for the lectures on one index page."""
+    seminar_sections = []
+    # A seminar that spans two pages gets a section on each of them
+    for seminar_name, group in groupby(page_lectures, key=lambda entry: entry[0]):
+        lecture_items = [
+            LECTURE_ITEM_TEMPLATE.format(
+                lecture_name=html.escape(lecture['name']),
+                lecture_path=html.escape(quote(lecture['path']))
+            )
+            for _, lecture in group
+        ]
+        seminar_sections.append(SEMINAR_SECTION_TEMPLATE.format(
+            seminar_name=html.escape(seminar_name),
+            lecture_items=''.join(lecture_items)
+        ))
+    return '\n'.join(seminar_sections)
+
 
 def generate_index_page(manifest_path: Path, output_dir: Path):
-    """Generate the index HTML page."""
+    """
+    Generate the index HTML pages.
+    
+    Lectures are split into pages of PAGE_SIZE, and lectures.min.json holds
+    the search index for all of them.
+    """
     # Load manifest
-    with open(manifest_path, 'r', encoding='utf-8') as f:
-        bundles = json.load(f)
+    bundles = orjson.loads(manifest_path.read_bytes())
     
-    # Initialize total_lectures before the if/else block
-    total_lectures = 0
+    # Sort seminars and their lectures alphabetically
+    lectures = [
+        (seminar_name, lecture)
+        for seminar_name in sorted(bundles.keys())
+        for lecture in sorted(bundles[seminar_name], key=lambda x: x['name'])
+    ]
+    total_seminars = len(bundles)
+    total_lectures = len(lectures)
     
-    if not bundles:
-        # Empty state
-        index_html = INDEX_TEMPLATE.format(
-            total_seminars=0,
-            plural_seminars='s',
-            total_lectures=0,
-            plural_lectures='s',
-            seminar_sections='<div class="empty-state"><h2>No lectures available</h2><p>Transcriptions will appear here once they are generated.</p></div>'
-        )
-    else:
-        # Generate seminar sections
-        seminar_sections = []
-        
-        # Sort seminars alphabetically
-        for seminar_name in sorted(bundles.keys()):
-            lectures = bundles[seminar_name]
-            total_lectures += len(lectures)
-            
-            # Generate lecture items
-            lecture_items = []
-            # Sort lectures alphabetically
-            for lecture in sorted(lectures, key=lambda x: x['name']):
-                lecture_items.append(LECTURE_ITEM_TEMPLATE.format(
-                    lecture_name=lecture['name'],
-                    lecture_path=lecture['path']
-                ))
-            
-            seminar_sections.append(SEMINAR_SECTION_TEMPLATE.format(
-                seminar_name=seminar_name,
-                lecture_items=''.join(lecture_items)
-            ))
+    # Search index with only what the results need, lowercased once here
+    search_index = [
+        {
+            'n': lecture['name'],
+            's': seminar_name,
+            'p': quote(lecture['path']),
+            't': f"{seminar_name} {lecture['name']}".lower()
+        }
+        for seminar_name, lecture in lectures
+    ]
+    write_if_changed(output_dir / "lectures.min.json", orjson.dumps(search_index))
+    
+    pages = [lectures[i:i + PAGE_SIZE] for i in range(0, total_lectures, PAGE_SIZE)] or [[]]
+    written = 0
+    for page_number, page_lectures in enumerate(pages, start=1):
+        if page_lectures:
+            seminar_sections = render_seminar_sections(page_lectures)
+        else:
+            # Empty state
+            seminar_sections = '<div class="empty-state"><h2>No lectures available</h2><p>Transcriptions will appear here once they are generated.</p></div>'
         
         index_html = INDEX_TEMPLATE.format(
-            total_seminars=len(bundles),
-            plural_seminars='s' if len(bundles) != 1 else '',
+            total_seminars=total_seminars,
+            plural_seminars='s' if total_seminars != 1 else '',
             total_lectures=total_lectures,
             plural_lectures='s' if total_lectures != 1 else '',
-            seminar_sections='\n'.join(seminar_sections)
+            seminar_sections=seminar_sections,
+            pagination=render_pagination(page_number, len(pages))
         )
+        
+        # Write index file, leaving it untouched if nothing changed
+        if write_if_changed(output_dir / page_filename(page_number), index_html.encode('utf-8')):
+            written += 1
     
-    # Write index file
-    with open(output_dir / "index.html", 'w', encoding='utf-8') as f:
-        f.write(index_html)
+    # Remove pages left over from a run with more lectures
+    for stale_page in output_dir.glob("page-*.html"):
+        suffix = stale_page.stem[len("page-"):]
+        if not suffix.isdigit() or int(suffix) > len(pages):
+            stale_page.unlink()
     
-    print(f"✅ Generated index page with {len(bundles)} seminar(s) and {total_lectures} lecture(s)")
+    print(f"✅ Generated {len(pages)} index page(s) with {total_seminars} seminar(s) and {total_lectures} lecture(s), {written} updated")
 
 
 def copy_react_transcript_editor_bundle(output_dir: Path, base_dir: Path):
@@ -0,0 +1,27 @@
+"""
+File writing helpers shared by the GitHub Pages generation scripts.
+"""
+
+import os
+from pathlib import Path
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """
+    Write content to path unless the file already holds exactly these bytes.
+    
+    The content goes to a temporary file that is renamed over the target, so
+    an interrupted run never leaves a truncated page behind.
+    
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return True
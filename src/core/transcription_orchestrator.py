@@ -1,8 +1,10 @@
 """Main orchestrator for the transcription workflow."""
 
 import asyncio
+from concurrent.futures import Executor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 import time
 
 from ..utils.config import ConfigManager
@@ -22,11 +24,15 @@ class TranscriptionOrchestrator:
     """Main orchestrator that coordinates all transcription workflow components."""
     
     def __init__(self, config_manager: ConfigManager, output_dir: Path, 
-                 verbose: bool = False, fail_fast: bool = True):
+                 verbose: bool = False, fail_fast: bool = True,
+                 executor: Optional[Executor] = None):
         self.config_manager = config_manager
         self.output_dir = Path(output_dir)
         self.verbose = verbose
         self.fail_fast = fail_fast
+        # Runs blocking work (compression, writing results); None means the
+        # event loop's default executor
+        self.executor = executor
         
         # Initialize core components
         # Note: output_manager is now created per-file in the new structure
@@ -60,9 +66,16 @@ class TranscriptionOrchestrator:
         service: str,
         output_formats: List[str],
         glossary_files: Optional[List[Path]] = None,
-        compress_audio: bool = False
+        compress_audio: bool = False,
+        progress_callback: Optional[Callable[[float, str], None]] = None
     ) -> Dict[str, Any]:
-        """Run the complete transcription workflow."""
+        """
+        Run the complete transcription workflow.
+        
+        progress_callback, if given, is called with the completed fraction of
+        the files to process (0.0 to 1.0) and a message whenever a file moves
+        to its next step.
+        """
         
         workflow_result = {
             'success': False,
@@ -159,7 +172,8 @@ class TranscriptionOrchestrator:
             
             # Step 7: Process files
             workflow_result.update(await self._process_files_batch(
-                files_to_process, client, service, transcription_config, output_formats
+                files_to_process, client, service, transcription_config, output_formats,
+                progress_callback
             ))
             
             # Step 8: Finalize
@@ -185,7 +199,8 @@ class TranscriptionOrchestrator:
         client,
         service: str,
         transcription_config: TranscriptionConfig,
-        output_formats: List[str]
+        output_formats: List[str],
+        progress_callback: Optional[Callable[[float, str], None]] = None
     ) -> Dict[str, Any]:
         """Process a batch of files for transcription."""
         
@@ -195,8 +210,12 @@ class TranscriptionOrchestrator:
             'failed_files': 0
         }
         
-        for audio_file in files_to_process:
+        total_files = len(files_to_process)
+        for index, audio_file in enumerate(files_to_process):
             try:
+                if progress_callback:
+                    progress_callback(index / total_files, f"Processing {audio_file.name} ({index + 1}/{total_files})...")
+                
                 # Start tracking this file
                 if self.progress_tracker:
                     file_size_mb = audio_file.stat().st_size / (1024 * 1024)
@@ -204,7 +223,8 @@ class TranscriptionOrchestrator:
                 
                 # Process single file
                 file_result = await self._process_single_file(
-                    audio_file, client, service, transcription_config, output_formats
+                    audio_file, client, service, transcription_config, output_formats,
+                    partial(progress_callback, index / total_files) if progress_callback else None
                 )
                 
                 batch_result['processed_files'] += 1
@@ -252,7 +272,8 @@ class TranscriptionOrchestrator:
         client,
         service: str,
         transcription_config: TranscriptionConfig,
-        output_formats: List[str]  # Ignored in new structure
+        output_formats: List[str],  # Ignored in new structure
+        report_step: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """Process a single audio file through the simplified workflow."""
         
@@ -287,13 +308,15 @@ class TranscriptionOrchestrator:
                 try:
                     if self.verbose:
                         print(f"🗜️  Compressing audio for transcription and storage...")
+                    if report_step:
+                        report_step(f"Compressing {audio_file.name}...")
                     
-                    # Always compress for transcription to save bandwidth
-                    compressed_file = self.audio_processor.compress_audio(audio_file, force=True)
-                    
-                    # Move compressed file to correct location
-                    import shutil
-                    shutil.move(str(compressed_file), str(compressed_audio_path))
+                    # Always compress for transcription to save bandwidth. FFmpeg
+                    # runs for a while, so keep it off the event loop
+                    await asyncio.get_running_loop().run_in_executor(
+                        self.executor,
+                        self.audio_processor.compress_audio_to, audio_file, compressed_audio_path, True
+                    )
                     
                     # Use compressed file for transcription
                     file_to_transcribe = compressed_audio_path
@@ -323,6 +346,8 @@ class TranscriptionOrchestrator:
             
             if self.verbose:
                 print(f"📤 Uploading to {service.upper()} ({upload_size_mb:.1f} MB)...")
+            if report_step:
+                report_step(f"Transcribing {audio_file.name} with {service}...")
             
             upload_start = time.time()
             
@@ -338,6 +363,8 @@ class TranscriptionOrchestrator:
             
             # Step 3: Save raw Deepgram response to correct location
             transcription_path = output_manager.get_transcription_path()
+            if report_step:
+                report_step(f"Saving transcription for {audio_file.name}...")
             
             try:
                 import json
@@ -367,8 +394,11 @@ class TranscriptionOrchestrator:
                     }
                 }
                 
-                with open(transcription_path, 'w', encoding='utf-8') as f:
-                    json.dump(transcription_data, f, indent=2, ensure_ascii=False)
+                def write_transcription():
+                    with open(transcription_path, 'w', encoding='utf-8') as f:
+                        json.dump(transcription_data, f, indent=2, ensure_ascii=False)
+                
+                await asyncio.get_running_loop().run_in_executor(self.executor, write_transcription)
                 
                 file_result['transcription_file'] = str(transcription_path)
                 file_result['success'] = True
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import html
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 
 from .base_formatter import BaseFormatter
 from ..services.transcription_client import TranscriptionResult
@@ -331,30 +333,12 @@ class HTMLFormatter(BaseFormatter):
         html_parts = ['<div class="transcript-container">']
         html_parts.append('<h2>Speaker Transcript</h2>')
         
-        # Group segments by speaker into paragraphs with timestamps
-        current_speaker = None
-        current_paragraph = []
-        current_paragraph_start_time = None
-        
-        for segment in result.speakers:
-            # If speaker changed, finish current paragraph and start new one
-            if segment.speaker != current_speaker:
-                if current_paragraph and current_paragraph_start_time is not None:
-                    # Add timestamp to every paragraph
-                    self._add_speaker_paragraph(html_parts, current_speaker, current_paragraph, speaker_colors, 
-                                              current_paragraph_start_time)
-                    current_paragraph = []
-                
-                current_speaker = segment.speaker
-                current_paragraph_start_time = segment.start_time
-            
-            # Add segment text to current paragraph
-            current_paragraph.append(segment.text.strip())
-        
-        # Add final paragraph
-        if current_paragraph and current_paragraph_start_time is not None:
-            self._add_speaker_paragraph(html_parts, current_speaker, current_paragraph, speaker_colors,
-                                      current_paragraph_start_time)
+        # Group consecutive segments of the same speaker into paragraphs in one sweep;
+        # every paragraph gets the timestamp of its first segment
+        for speaker, segments in groupby(result.speakers, key=attrgetter('speaker')):
+            segments = list(segments)
+            self._add_speaker_paragraph(html_parts, speaker, [segment.text.strip() for segment in segments],
+                                        speaker_colors, segments[0].start_time)
         
         html_parts.append('</div>')
         return "\n".join(html_parts)
@@ -402,14 +386,18 @@ class HTMLFormatter(BaseFormatter):
         sentences = re.split(r'(?<=[.!?])\s+', text)
         paragraphs = []
         current_paragraph = []
+        # Length of ' '.join(current_paragraph), kept up to date instead of re-joining
+        current_length = -1
         
-        for i, sentence in enumerate(sentences):
+        for sentence in sentences:
             current_paragraph.append(sentence)
+            current_length += len(sentence) + 1
             
             # Start new paragraph every 3-4 sentences or if sentence is very long
-            if (len(current_paragraph) >= 3 and len(' '.join(current_paragraph)) > 200) or len(' '.join(current_paragraph)) > 400:
+            if (len(current_paragraph) >= 3 and current_length > 200) or current_length > 400:
                 paragraphs.append(' '.join(current_paragraph))
                 current_paragraph = []
+                current_length = -1
         
         # Add remaining sentences
         if current_paragraph:
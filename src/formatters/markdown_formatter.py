@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 
 from .base_formatter import BaseFormatter
 from ..services.transcription_client import TranscriptionResult
@@ -149,39 +151,21 @@ class MarkdownFormatter(BaseFormatter):
         """Build speaker transcript section with paragraph-based formatting."""
         markdown_parts = ["## Speaker Transcript", ""]
         
-        # Group segments by speaker into paragraphs with timestamps
-        current_speaker = None
-        current_paragraph = []
-        current_paragraph_start_time = None
+        # Group consecutive segments of the same speaker into paragraphs in one sweep
         last_timestamp_marker = -1.0  # Start with -1 so first paragraph always gets timestamp
         
-        for segment in result.speakers:
-            # If speaker changed, finish current paragraph and start new one
-            if segment.speaker != current_speaker:
-                if current_paragraph and current_paragraph_start_time is not None:
-                    # Check if we need a timestamp marker for this paragraph
-                    needs_timestamp = (self.timestamp_blockquotes and 
-                                     self._should_add_timestamp_marker(current_paragraph_start_time, last_timestamp_marker, interval=120))
-                    if needs_timestamp:
-                        last_timestamp_marker = current_paragraph_start_time
-                    
-                    # Finish previous speaker's paragraph
-                    self._add_speaker_paragraph_md(markdown_parts, current_speaker, current_paragraph,
-                                                  current_paragraph_start_time if needs_timestamp else None)
-                    current_paragraph = []
-                
-                current_speaker = segment.speaker
-                current_paragraph_start_time = segment.start_time
+        for speaker, segments in groupby(result.speakers, key=attrgetter('speaker')):
+            segments = list(segments)
+            paragraph_start_time = segments[0].start_time
             
-            # Add segment text to current paragraph
-            current_paragraph.append(segment.text.strip())
-        
-        # Add final paragraph
-        if current_paragraph and current_paragraph_start_time is not None:
+            # Check if we need a timestamp marker for this paragraph
             needs_timestamp = (self.timestamp_blockquotes and 
-                             self._should_add_timestamp_marker(current_paragraph_start_time, last_timestamp_marker, interval=120))
-            self._add_speaker_paragraph_md(markdown_parts, current_speaker, current_paragraph,
-                                          current_paragraph_start_time if needs_timestamp else None)
+                             self._should_add_timestamp_marker(paragraph_start_time, last_timestamp_marker, interval=120))
+            if needs_timestamp:
+                last_timestamp_marker = paragraph_start_time
+            
+            self._add_speaker_paragraph_md(markdown_parts, speaker, [segment.text.strip() for segment in segments],
+                                          paragraph_start_time if needs_timestamp else None)
         
         return markdown_parts
     
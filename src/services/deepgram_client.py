@@ -3,6 +3,7 @@
 import asyncio
 import aiohttp
 import aiofiles
+import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import time
@@ -129,7 +130,8 @@ class DeepgramClient(TranscriptionClient):
             # Handle both old and new format
             speaker_id = utterance.get("speaker", utterance.get("speaker_id", 0))
             speaker_segment = SpeakerSegment(
-                speaker=f"Speaker {speaker_id}",
+                # Interned: every utterance of a speaker shares one label string
+                speaker=sys.intern(f"Speaker {speaker_id}"),
                 start_time=utterance.get("start", 0.0),
                 end_time=utterance.get("end", 0.0),
                 text=utterance.get("transcript", ""),
@@ -151,7 +153,7 @@ class DeepgramClient(TranscriptionClient):
             paragraphs = results.get("paragraphs", {}).get("paragraphs", [])
             for i, paragraph in enumerate(paragraphs):
                 speaker_segment = SpeakerSegment(
-                    speaker=f"Speaker {paragraph.get('speaker', 0)}",
+                    speaker=sys.intern(f"Speaker {paragraph.get('speaker', 0)}"),
                     start_time=paragraph.get("start", 0.0),
                     end_time=paragraph.get("end", 0.0),
                     text=paragraph.get("text", ""),
@@ -192,16 +194,15 @@ class DeepgramClient(TranscriptionClient):
             'biological age', 'conductivity reading', 'pH meter', 'debris reading'
         ]
         
-        # Find priority terms that exist in our glossary
+        # Find priority terms that exist in our glossary; each word is lowercased once
         selected_terms = []
         words_lower = [w.lower() for w in words]
         
         for priority_term in priority_terms:
+            priority_lower = priority_term.lower()
             # Look for exact matches or partial matches
-            for word in words:
-                if (priority_term.lower() == word.lower() or 
-                    priority_term.lower() in word.lower() or
-                    word.lower() in priority_term.lower()):
+            for word, word_lower in zip(words, words_lower):
+                if priority_lower in word_lower or word_lower in priority_lower:
                     if word not in selected_terms:
                         selected_terms.append(word)
                         break
@@ -210,13 +211,13 @@ class DeepgramClient(TranscriptionClient):
         remaining_slots = limit - len(selected_terms)
         if remaining_slots > 0:
             # Prefer shorter, more specific terms
-            remaining_words = [w for w in words if w not in selected_terms]
+            selected = set(selected_terms)
+            remaining_words = [(w, w_lower) for w, w_lower in zip(words, words_lower) if w not in selected]
             
             # Score terms by RBTI relevance and length
             scored_terms = []
-            for word in remaining_words:
+            for word, word_lower in remaining_words:
                 score = 0
-                word_lower = word.lower()
                 
                 # Boost RBTI-specific patterns
                 if any(pattern in word_lower for pattern in ['ph', 'ion', 'bio', 'mineral', 'calc', 'magn', 'reams']):
@@ -272,24 +273,23 @@ class DeepgramClient(TranscriptionClient):
                     # Optional: log the selected keyterms for debugging
                     # print(f"Using {len(best_keyterms)} keyterms for Nova-3: {best_keyterms[:10]}...")
             
-            # Read audio file
-            async with aiofiles.open(file_path, 'rb') as f:
-                audio_data = await f.read()
-            
-            # Make request to Deepgram
-            async with session.post(self.LISTEN_URL, params=params, data=audio_data) as response:
-                if response.status == 401:
-                    raise AuthenticationError("Invalid Deepgram API key")
-                elif response.status == 413:
-                    raise AudioUploadError("File too large for Deepgram. Try compressing the audio file.")
-                elif response.status != 200:
-                    error_text = await response.text()
-                    raise TranscriptionJobError(f"Deepgram transcription failed with status {response.status}: {error_text}")
-                
-                result = await response.json()
-                processing_time = time.time() - start_time
-                
-                return self._parse_transcription_result(result, processing_time)
+            # Stream the audio file to Deepgram instead of reading it into memory
+            # first; aiohttp sends a file object in chunks read off the event
+            # loop, with the Content-Length taken from the file size
+            with open(file_path, 'rb') as audio_file:
+                async with session.post(self.LISTEN_URL, params=params, data=audio_file) as response:
+                    if response.status == 401:
+                        raise AuthenticationError("Invalid Deepgram API key")
+                    elif response.status == 413:
+                        raise AudioUploadError("File too large for Deepgram. Try compressing the audio file.")
+                    elif response.status != 200:
+                        error_text = await response.text()
+                        raise TranscriptionJobError(f"Deepgram transcription failed with status {response.status}: {error_text}")
+                    
+                    result = await response.json()
+                    processing_time = time.time() - start_time
+                    
+                    return self._parse_transcription_result(result, processing_time)
         
         except aiohttp.ClientError as e:
             raise TranscriptionJobError(f"Network error during Deepgram transcription: {str(e)}")
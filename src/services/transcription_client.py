@@ -36,7 +36,14 @@ class TranscriptionConfig:
 
 @dataclass
 class SpeakerSegment:
-    """Represents a segment of speech from a specific speaker."""
+    """
+    Represents a segment of speech from a specific speaker.
+    
+    A transcript holds one of these per utterance, so it uses __slots__
+    rather than a per-instance dict.
+    """
+    __slots__ = ('speaker', 'start_time', 'end_time', 'text', 'confidence')
+    
     speaker: str
     start_time: float
     end_time: float
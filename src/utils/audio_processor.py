@@ -30,7 +30,8 @@ class AudioProcessor:
     def _get_compressed_cache_path(self, input_file: Path) -> Path:
         """Get cache path for compressed audio file."""
         # Create hash based on file path and modification time
-        file_info = f"{input_file}_{input_file.stat().st_mtime}_{input_file.stat().st_size}"
+        stat_result = input_file.stat()
+        file_info = f"{input_file}_{stat_result.st_mtime}_{stat_result.st_size}"
         file_hash = hashlib.md5(file_info.encode()).hexdigest()[:12]
         return self.compressed_cache_dir / f"{input_file.stem}_{file_hash}_compressed.mp3"
     
@@ -149,6 +150,21 @@ class AudioProcessor:
         except subprocess.CalledProcessError as e:
             raise FileSystemError(f"FFmpeg compression failed for {input_file}: {e.stderr}")
     
+    def compress_audio_to(self, input_file: Path, output_path: Path, force: bool = False) -> Path:
+        """
+        Compress audio file and move the result to output_path.
+        
+        The compressed file is renamed into place, which is a single rename
+        when the cache directory and output_path share a filesystem. If the
+        input needs no compression it is copied, so the original stays put.
+        """
+        compressed_file = self.compress_audio(input_file, force=force)
+        if compressed_file == input_file:
+            shutil.copy2(str(input_file), str(output_path))
+        else:
+            shutil.move(str(compressed_file), str(output_path))
+        return output_path
+    
     def get_compression_stats(self, original_file: Path, compressed_file: Path) -> Dict[str, Any]:
         """Get compression statistics comparing original and compressed files."""
         original_info = self.analyze_audio_bitrate(original_file)
@@ -2,6 +2,8 @@
 
 import json
 import hashlib
+import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -9,17 +11,24 @@ from datetime import datetime
 from .exceptions import FileSystemError
 from ..services.transcription_client import TranscriptionResult, SpeakerSegment
 
+# Cache directories already created by this process. The web API builds a
+# CacheManager per request, and this saves a mkdir for every one of them.
+_created_directories = set()
+
 
 class CacheManager:
     """Manages caching of transcription service responses and resume logic."""
     
     def __init__(self, cache_directory: Path):
         self.cache_directory = Path(cache_directory)
-        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        if self.cache_directory not in _created_directories:
+            self.cache_directory.mkdir(parents=True, exist_ok=True)
+            _created_directories.add(self.cache_directory)
     
     def _get_cache_key(self, audio_file: Path, service: str, config_hash: str) -> str:
         """Generate unique cache key for audio file, service, and configuration."""
-        file_info = f"{audio_file.name}_{audio_file.stat().st_size}_{audio_file.stat().st_mtime}"
+        stat_result = audio_file.stat()
+        file_info = f"{audio_file.name}_{stat_result.st_size}_{stat_result.st_mtime}"
         cache_input = f"{file_info}_{service}_{config_hash}"
         return hashlib.md5(cache_input.encode()).hexdigest()
     
@@ -70,10 +79,23 @@ class CacheManager:
             }
         }
         
+        # Write to a temporary file and rename it into place, so an interrupted
+        # write never leaves a truncated cache file behind. Cache files are only
+        # read back by the tools, so they are written without indentation
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            try:
+                f = open(tmp_path, 'w', encoding='utf-8')
+            except FileNotFoundError:
+                # The directory is only created once per process, so recreate
+                # it if it was removed since
+                self.cache_directory.mkdir(parents=True, exist_ok=True)
+                f = open(tmp_path, 'w', encoding='utf-8')
+            with f:
+                json.dump(cache_data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
         except IOError as e:
+            tmp_path.unlink(missing_ok=True)
             raise FileSystemError(f"Cannot save cache file {cache_path}: {e}")
     
     def load_result(self, audio_file: Path, service: str, config: Dict[str, Any]) -> Optional[TranscriptionResult]:
@@ -93,10 +115,11 @@ class CacheManager:
             
             result_data = cache_data['result']
             
-            # Reconstruct SpeakerSegment objects
+            # Reconstruct SpeakerSegment objects; the few speaker labels repeat
+            # on every segment, so they are interned rather than kept per segment
             speakers = [
                 SpeakerSegment(
-                    speaker=segment['speaker'],
+                    speaker=sys.intern(segment['speaker']),
                     start_time=segment['start_time'],
                     end_time=segment['end_time'],
                     text=segment['text'],
@@ -2,6 +2,7 @@
 
 import logging
 import traceback
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -127,25 +128,17 @@ class ErrorHandler:
                 'recent_errors': []
             }
         
-        # Count by severity
-        severity_counts = {}
-        for error in self.error_log:
-            severity = error['severity']
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
-        # Count by type
-        type_counts = {}
-        for error in self.error_log:
-            error_type = error['error_type']
-            type_counts[error_type] = type_counts.get(error_type, 0) + 1
+        # Count by severity and type
+        severity_counts = Counter(error['severity'] for error in self.error_log)
+        type_counts = Counter(error['error_type'] for error in self.error_log)
         
         # Get recent errors (last 10)
         recent_errors = self.error_log[-10:] if len(self.error_log) > 10 else self.error_log
         
         return {
             'total_errors': len(self.error_log),
-            'by_severity': severity_counts,
-            'by_type': type_counts,
+            'by_severity': dict(severity_counts),
+            'by_type': dict(type_counts),
             'recent_errors': [
                 {
                     'timestamp': error['timestamp'],
@@ -38,20 +38,40 @@ class MP3FileScanner:
             'metadata'        # Metadata directory
         }
         
-        # Find all .mp3 files recursively, excluding output directories
-        for file_path in self.base_directory.rglob("*.mp3"):
-            if file_path.is_file():
-                # Check if file is in an excluded directory
-                if any(excluded_dir in file_path.parts for excluded_dir in exclude_dirs):
-                    continue
-                
-                # Check if file is a compressed file (ends with _compressed.mp3)
-                if file_path.name.endswith('_compressed.mp3'):
+        # Find all .mp3 files recursively with os.scandir. Excluded output
+        # directories are never entered, and each entry's type comes from the
+        # directory listing, so a file costs one stat for its size
+        pending = [self.base_directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as scan:
+                    entries = list(scan)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            pending.append(Path(entry.path))
+                        continue
+                    
+                    # Skip other files and compressed files (ending with _compressed.mp3);
+                    # the extension is matched case-insensitively, like the API's scanner
+                    if not entry.name.lower().endswith('.mp3') or entry.name.endswith('_compressed.mp3'):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    file_size = entry.stat().st_size
+                except OSError:
                     continue
                 
+                file_path = Path(entry.path)
                 try:
-                    if self.validate_mp3_file(file_path):
-                        mp3_files.append(file_path)
+                    if file_size == 0:
+                        raise AudioValidationError(f"File is empty: {file_path}")
+                    self._validate_mp3_header(file_path)
+                    mp3_files.append(file_path)
                 except AudioValidationError as e:
                     print(f"Warning: Skipping invalid MP3 file {file_path}: {e}")
                     continue
@@ -66,7 +86,10 @@ class MP3FileScanner:
         if file_path.stat().st_size == 0:
             raise AudioValidationError(f"File is empty: {file_path}")
         
-        # Check file header
+        return self._validate_mp3_header(file_path)
+    
+    def _validate_mp3_header(self, file_path: Path) -> bool:
+        """Validate that a file starts with an MP3 frame or ID3 tag header."""
         try:
             with open(file_path, 'rb') as f:
                 header = f.read(10)
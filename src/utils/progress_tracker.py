@@ -1,6 +1,7 @@
 """Progress tracking and reporting for transcription operations."""
 
 import time
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
@@ -179,10 +180,7 @@ class ProgressTracker:
             if fp.status == 'failed'
         ]
         
-        error_summary = {}
-        for fp in failed_files:
-            error = fp.error_message or "Unknown error"
-            error_summary[error] = error_summary.get(error, 0) + 1
+        error_summary = dict(Counter(fp.error_message or "Unknown error" for fp in failed_files))
         
         return {
             'batch_summary': {
@@ -211,14 +209,14 @@ class ProgressTracker:
     
     def _get_output_format_summary(self) -> Dict[str, int]:
         """Get summary of output formats generated."""
-        format_counts = {}
-        
-        for fp in self.batch_progress.file_progress.values():
-            if fp.status == 'completed':
-                for format_type in fp.output_formats:
-                    format_counts[format_type] = format_counts.get(format_type, 0) + 1
+        format_counts = Counter(
+            format_type
+            for fp in self.batch_progress.file_progress.values()
+            if fp.status == 'completed'
+            for format_type in fp.output_formats
+        )
         
-        return format_counts
+        return dict(format_counts)
     
     def _save_progress(self) -> None:
         """Save progress to JSON file if output directory is specified."""